@@ -1,7 +1,82 @@
 import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List
 
-from ..config import DISCORD_BOT_TOKEN
+from ..config import DISCORD_BOT_TOKEN, DISCORD_SEND_INTERVAL, DISCORD_WORKERS, WORLD_IDLE_SECONDS
+
+# Discord rejects messages over 2000 characters; keep a margin for formatting.
+MESSAGE_LIMIT = 1900
+
+
+def _chunks(text: str, limit: int) -> List[str]:
+    """Split text into pieces of at most `limit` chars, preferring line breaks."""
+    out: List[str] = []
+    while len(text) > limit:
+        cut = text.rfind("\n", 0, limit)
+        if cut <= 0:
+            cut = limit
+        out.append(text[:cut])
+        text = text[cut:].lstrip("\n")
+    if text:
+        out.append(text)
+    return out
+
+
+class OutboundQueue:
+    """Per-interaction outbound buffer with coalescing and send pacing.
+
+    Each interaction has its own follow-up webhook token, and so its own
+    rate limit. Messages queued for an interaction are held for a short
+    window, merged into as few capped sends as possible, and sent no faster
+    than one per `interval` seconds for that interaction only, so a burst of
+    commands in one channel is answered in parallel. 429s are retried by
+    py-cord's HTTP client; sends that still fail are logged and dropped.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Any, str], Awaitable[Any]],
+        interval: float = 0.1,
+        window: float = 0.05,
+        limit: int = MESSAGE_LIMIT,
+    ):
+        self._send = send
+        self.interval = interval
+        self.window = window
+        self.limit = limit
+        self._pending: Dict[Any, List[str]] = {}
+        self._tasks: Dict[Any, asyncio.Task] = {}
+
+    def put(self, target: Any, text: str) -> None:
+        self._pending.setdefault(target, []).append(text)
+        if target not in self._tasks:
+            loop = asyncio.get_running_loop()
+            self._tasks[target] = loop.create_task(self._drain(target))
+
+    async def join(self) -> None:
+        """Wait until every queued message has been sent."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks.values()))
+
+    async def _drain(self, target: Any) -> None:
+        loop = asyncio.get_running_loop()
+        next_at = 0.0
+        try:
+            await asyncio.sleep(self.window)
+            while self._pending.get(target):
+                batch = self._pending.pop(target)
+                for text in _chunks("\n".join(batch), self.limit):
+                    delay = next_at - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    try:
+                        await self._send(target, text)
+                    except Exception as e:
+                        print(f"Dropped outbound message: {e!r}")
+                    next_at = loop.time() + self.interval
+        finally:
+            self._tasks.pop(target, None)
 
 
 def main() -> int:
@@ -11,31 +86,75 @@ def main() -> int:
         print("py-cord is not installed. Install dependencies from requirements.txt.")
         return 1
 
-    from ..engine.commands import GameState, dispatch
-    from ..engine.models import Player
+    from ..engine.commands import dispatch
+    from ..engine.persistence import get_engine
+    from ..engine.worlds import WorldRegistry
 
     intents = discord.Intents.default()
     bot = discord.Bot(intents=intents)
+    # Threads rather than processes: GameState holds live objects that do not pickle.
+    pool = ThreadPoolExecutor(max_workers=max(1, DISCORD_WORKERS), thread_name_prefix="astrarpg")
+
+    async def _followup(ctx, text: str):
+        await ctx.followup.send(text)
+
+    outbound = OutboundQueue(_followup, interval=DISCORD_SEND_INTERVAL)
+    # One world per guild, each with its own sessions, seeds, board and hazards.
+    registry = WorldRegistry(get_engine())
+    evicting: List[asyncio.Task] = []
+
+    async def _evict_idle():
+        # Idle guilds are saved and dropped wholesale; only safe with a database to save to.
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(max(1.0, WORLD_IDLE_SECONDS / 4))
+            try:
+                # Per-world save failures are logged inside evict_idle; this keeps the task alive
+                await loop.run_in_executor(pool, registry.evict_idle, WORLD_IDLE_SECONDS)
+            except Exception as e:
+                print(f"Idle-world eviction failed: {e!r}")
 
     @bot.event
     async def on_ready():
         print(f"Logged in as {bot.user}")
+        if registry.engine is not None and not evicting:
+            evicting.append(asyncio.create_task(_evict_idle()))
 
-    @bot.slash_command(description="Play AstraRPG commands")
+    @bot.slash_command(description="Play AstraRPG commands (chain several with ';')")
     async def rpg(ctx, command: str):
+        # Acknowledge inside Discord's 3s window; the real reply is a follow-up.
+        await ctx.defer()
+        # DMs have no guild and share the default world.
+        world_id = str(ctx.guild_id) if ctx.guild_id else ""
         pid = f"discord:{ctx.author.id}"
-        gs = GameState(Player(id=pid, name=ctx.author.display_name))
-        msg, _ = dispatch(gs, command)
-        await ctx.respond(msg[:1900])
+        name = ctx.author.display_name
+
+        def run():
+            # Loading a guild's world may hit the database, so it runs off the event loop too.
+            gs = registry.get(world_id).session(pid, name)
+            return dispatch(gs, command)
+
+        loop = asyncio.get_running_loop()
+        try:
+            msg, _ = await loop.run_in_executor(pool, run)
+        except Exception as e:
+            msg = f"Something went wrong: {e}"
+        outbound.put(ctx, msg)
 
     token = DISCORD_BOT_TOKEN or os.getenv("DISCORD_BOT_TOKEN")
     if not token:
         print("Set DISCORD_BOT_TOKEN in your environment to run the bot.")
         return 1
-    bot.run(token)
+    try:
+        bot.run(token)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        if registry.engine is not None:
+            failed = registry.unload_all()
+            if failed:
+                print(f"Could not save {len(failed)} world(s): {', '.join(failed)}")
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
@@ -35,6 +35,11 @@ DB_URL: str = _get_str("ASTRARPG_DB_URL", "sqlite:///astrarpg.db") or "sqlite://
 ENV: str = _get_str("ASTRARPG_ENV", "dev") or "dev"
 DEFAULT_TEMPERATURE: float = _get_float("ASTRARPG_DEFAULT_TEMPERATURE", 0.9)
 THINKING_BUDGET: int = _get_int("ASTRARPG_THINKING_BUDGET", -1)
+DISCORD_WORKERS: int = _get_int("ASTRARPG_DISCORD_WORKERS", 8)
+DISCORD_SEND_INTERVAL: float = _get_float("ASTRARPG_DISCORD_SEND_INTERVAL", 0.1)
+WORLD_IDLE_SECONDS: float = _get_float("ASTRARPG_WORLD_IDLE_SECONDS", 3600.0)
+CONTENT_PACKS: str = _get_str("ASTRARPG_CONTENT_PACKS", "") or ""
+CACHE_DIR: str = _get_str("ASTRARPG_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "astrarpg")
 
 __all__ = [
     "DISCORD_BOT_TOKEN",
@@ -43,5 +48,10 @@ __all__ = [
     "ENV",
     "DEFAULT_TEMPERATURE",
     "THINKING_BUDGET",
+    "DISCORD_WORKERS",
+    "DISCORD_SEND_INTERVAL",
+    "WORLD_IDLE_SECONDS",
+    "CONTENT_PACKS",
+    "CACHE_DIR",
 ]
 
@@ -1,3 +1,125 @@
-def render() -> str:
-    return "Ruined foundations sketch a grid in the soot."
+"""Base building on a grid with adjacency bonuses.
 
+The bonus total is kept as a running sum: placing or removing an object only
+looks at its four neighbours. The ASCII render caches one string per row and
+rebuilds just the rows touched since the last render.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set, Tuple
+
+# name -> glyph
+OBJECTS: Dict[str, str] = {
+    "hearth": "H",
+    "forge": "F",
+    "well": "W",
+    "garden": "g",
+    "shrine": "+",
+    "kennel": "k",
+    "wall": "#",
+}
+
+# Bonus per shared edge, keyed by the sorted pair of object names
+BONUSES: Dict[Tuple[str, str], int] = {
+    ("forge", "hearth"): 3,
+    ("forge", "well"): 2,
+    ("garden", "well"): 3,
+    ("garden", "shrine"): 2,
+    ("hearth", "kennel"): 2,
+    ("hearth", "shrine"): 1,
+    ("wall", "wall"): 1,
+}
+
+DEFAULT_SIZE = (16, 12)
+EMPTY = "."
+_NEIGHBOURS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+def pair_bonus(a: str, b: str) -> int:
+    return BONUSES.get((a, b) if a <= b else (b, a), 0)
+
+
+class Base:
+    __slots__ = ("w", "h", "cells", "bonus", "_rows", "_dirty", "_text")
+
+    def __init__(self, size: Tuple[int, int] = DEFAULT_SIZE):
+        self.w, self.h = size
+        self.cells: List[Optional[str]] = [None] * (self.w * self.h)
+        self.bonus = 0
+        self._rows: List[str] = [EMPTY * self.w] * self.h
+        self._dirty: Set[int] = set()
+        self._text: Optional[str] = None
+
+    def at(self, x: int, y: int) -> Optional[str]:
+        return self.cells[y * self.w + x]
+
+    def _edge_bonus(self, x: int, y: int, obj: str) -> int:
+        total = 0
+        for dx, dy in _NEIGHBOURS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.w and 0 <= ny < self.h:
+                other = self.cells[ny * self.w + nx]
+                if other is not None:
+                    total += pair_bonus(obj, other)
+        return total
+
+    def _check(self, x: int, y: int) -> None:
+        if not (0 <= x < self.w and 0 <= y < self.h):
+            raise ValueError("That spot lies beyond your walls.")
+
+    def place(self, x: int, y: int, obj: str) -> int:
+        """Place `obj` at (x, y); returns the bonus it adds."""
+        self._check(x, y)
+        if obj not in OBJECTS:
+            raise ValueError(f"Unknown structure. Choose: {', '.join(OBJECTS)}")
+        if self.at(x, y) is not None:
+            raise ValueError("Something already stands there.")
+        gained = self._edge_bonus(x, y, obj)
+        self.cells[y * self.w + x] = obj
+        self.bonus += gained
+        self._dirty.add(y)
+        self._text = None
+        return gained
+
+    def remove(self, x: int, y: int) -> Tuple[str, int]:
+        """Clear (x, y); returns the removed object and the bonus lost."""
+        self._check(x, y)
+        obj = self.at(x, y)
+        if obj is None:
+            raise ValueError("Nothing stands there.")
+        self.cells[y * self.w + x] = None
+        lost = self._edge_bonus(x, y, obj)
+        self.bonus -= lost
+        self._dirty.add(y)
+        self._text = None
+        return obj, lost
+
+    def recount(self) -> int:
+        """Full recomputation of the bonus total (for checks; place/remove keep it current)."""
+        total = 0
+        for y in range(self.h):
+            for x in range(self.w):
+                a = self.at(x, y)
+                if a is None:
+                    continue
+                # Count each edge once: right and down neighbours only
+                if x + 1 < self.w and self.at(x + 1, y) is not None:
+                    total += pair_bonus(a, self.at(x + 1, y))  # type: ignore[arg-type]
+                if y + 1 < self.h and self.at(x, y + 1) is not None:
+                    total += pair_bonus(a, self.at(x, y + 1))  # type: ignore[arg-type]
+        return total
+
+    def render(self) -> str:
+        if self._text is not None:
+            return self._text
+        for y in self._dirty:
+            row = self.cells[y * self.w : (y + 1) * self.w]
+            self._rows[y] = "".join(EMPTY if c is None else OBJECTS[c] for c in row)
+        self._dirty.clear()
+        self._text = "\n".join(self._rows)
+        return self._text
+
+
+def legend() -> str:
+    return "(" + ", ".join(f"{g}:{name}" for name, g in OBJECTS.items()) + ")"
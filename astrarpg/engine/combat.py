@@ -1,19 +1,29 @@
+from typing import Optional
+
 from .models import Player, Monster
 from .generation import rng_for
+from .hazards import Hazard
+from .skilltree import effective_stats
 
 
-def player_attack(player: Player, monster: Monster) -> str:
+def player_attack(player: Player, monster: Monster, hazard: Optional[Hazard] = None) -> str:
     rng = rng_for(player.id, "combat", monster.name)
-    swing = max(0, player.attack - monster.defense + rng.randint(0, 1))
+    atk, _ = effective_stats(player)
+    if hazard is not None:
+        atk += hazard.attack
+    swing = max(0, atk - monster.defense + rng.randint(0, 1))
     monster.hp = max(0, monster.hp - swing)
     if monster.hp == 0:
         return f"You strike for {swing}. The {monster.name} falls."
     return f"You strike for {swing}. {monster.name} has {monster.hp}/{monster.max_hp}."
 
 
-def monster_attack(player: Player, monster: Monster) -> str:
+def monster_attack(player: Player, monster: Monster, hazard: Optional[Hazard] = None) -> str:
     rng = rng_for("monster", monster.name, player.id)
-    swing = max(0, monster.attack - player.defense + rng.randint(0, 1))
+    _, dfn = effective_stats(player)
+    if hazard is not None:
+        dfn += hazard.defense
+    swing = max(0, monster.attack - dfn + rng.randint(0, 1))
     player.hp = max(0, player.hp - swing)
     if player.hp == 0:
         return f"{monster.name} hits for {swing}. You fall."
@@ -1,8 +1,10 @@
-from typing import Tuple
+import threading
+import time
+from typing import Iterable, Tuple
 
 from .models import Player, Monster, Item
 from .combat import player_attack, monster_attack
-from .generation import rng_for
+from .generation import in_world, rng_for
 
 
 class GameState:
@@ -20,6 +22,48 @@ class GameState:
         self.shop_cache: list | None = None
         # Bestiary discoveries
         self.discovered: set[str] = set()
+        # Idle progress accrues from this timestamp until the next 'claim'
+        self.clock = time.time
+        self.last_claim = self.clock()
+        self.produce = 0
+        # Farming: a bit-sliced field (see farming.Field), planted on demand
+        self.field = None
+        # Pets: tamed/bred beasts (see pets.Kennel)
+        from .pets import Kennel
+
+        self.kennel = Kennel()
+        self.tame_tried = False
+        self.tame_attempts = 0
+        # Base building grid (see basebuilding.Base)
+        from .basebuilding import Base
+
+        self.base = Base()
+        # Leaderboard this player reports to (None disables tracking)
+        from .leaderboard import BOARD
+
+        self.board = BOARD
+        # Regional hazards, shared with every player using the same cache
+        from .hazards import HAZARDS
+
+        self.hazards = HAZARDS
+        # Event chains: current node in the compiled book, and chains finished
+        self.event_node: int | None = None
+        self.events_done = 0
+        # World this player lives in ("" = default); mixed into every seed (see worlds.py)
+        self.world = ""
+        # Held while a command (or batch of commands) mutates this state
+        self.lock = threading.RLock()
+
+
+# Batches: commands separated by ';' run back to back under one lock
+BATCH_LIMIT = 20
+RESPONSE_CAP = 1900
+# Rows per page for long listings
+PAGE_SIZE = 10
+# Commands that can change item power; other commands only touch O(1) scores
+_POWER_COMMANDS = {"buy", "open", "take", "equip", "sell"}
+# Commands that can change idle-progress rates (attack, crop yield)
+_RATE_COMMANDS = {"equip", "sell", "learn", "farm"}
 
 
 def _spawn_monster(player: Player) -> Monster:
@@ -29,13 +73,101 @@ def _spawn_monster(player: Player) -> Monster:
     return m
 
 
+def _hazard_here(gs: GameState):
+    w, h = gs.map_size
+    x, y = gs.pos
+    return gs.hazards.get(x - w // 2, y - h // 2, gs.clock())
+
+
 def help_text() -> str:
     return (
-        "Commands: help, stats, attack, fish, inv, equip, zone, map, travel, shop, buy, open, shrine, take, bestiary, sell, farm, quit"
+        "Commands: help, stats, attack, fish, inv, equip, zone, map, travel, shop, buy, open, shrine, take, bestiary, sell, farm, claim, tame, stable, breed, pet, base, skills, learn, leaderboard, event, choose, quit. Chain commands with ';'"
     )
 
 
+def split_batch(raw: str) -> list[str]:
+    return [part.strip() for part in raw.split(";") if part.strip()]
+
+
+def dispatch_many(gs: GameState, commands: Iterable[str] | str) -> Tuple[str, bool]:
+    """Run a sequence of commands under a single hold of the state lock.
+
+    Accepts a list of commands or a ';'-separated string. Runs at most
+    BATCH_LIMIT commands, stops at quit, and caps the merged reply at
+    RESPONSE_CAP characters.
+    """
+    cmds = split_batch(commands) if isinstance(commands, str) else [c for c in commands if c.strip()]
+    if not cmds:
+        return ("Nothing to do.", False)
+    outs: list[str] = []
+    done = False
+    with gs.lock, in_world(gs.world):
+        for raw in cmds[:BATCH_LIMIT]:
+            msg, done = _dispatch(gs, raw)
+            outs.append(msg)
+            if done:
+                break
+        _track(gs, cmds[: len(outs)])
+    if len(cmds) > BATCH_LIMIT and not done:
+        outs.append(f"({len(cmds) - BATCH_LIMIT} more skipped; batch limit is {BATCH_LIMIT})")
+    text = "\n".join(outs)
+    if len(text) > RESPONSE_CAP:
+        text = text[: RESPONSE_CAP - 4] + "\n..."
+    return (text, done)
+
+
 def dispatch(gs: GameState, raw: str) -> Tuple[str, bool]:
+    if ";" in raw:
+        return dispatch_many(gs, raw)
+    if not raw.strip():
+        return ("Unknown command. Try 'help'.", False)
+    with gs.lock, in_world(gs.world):
+        out = _dispatch(gs, raw)
+        _track(gs, [raw])
+        return out
+
+
+def _track(gs: GameState, cmds: list[str]) -> None:
+    """Push this player's scores to their leaderboard after a command."""
+    if gs.board is None:
+        return
+    power = any(c.split()[0].lower().lstrip("!") in _POWER_COMMANDS for c in cmds)
+    gs.board.record(gs, power=power)
+
+
+def _settle(gs: GameState) -> str | None:
+    """Bank idle progress since the last claim at the current rates; None if nothing accrued."""
+    from .offline import FARM_YIELD, progress
+    from .skilltree import effective_stats
+
+    now = gs.clock()
+    farm_yield = FARM_YIELD
+    if gs.field is not None:
+        from .farming import cycle_yield
+
+        farm_yield = cycle_yield(gs.field, FARM_YIELD)
+    rep = progress(gs.player, gs.last_claim, now, attack=effective_stats(gs.player)[0], farm_yield=farm_yield)
+    gs.last_claim = now
+    if rep.is_empty():
+        return None
+    gs.produce += rep.produce
+    gs.player.gold += rep.gold
+    hours = rep.seconds / 3600
+    return (
+        f"While away ({hours:.1f}h): {rep.crop_cycles} crop cycles gave {rep.produce} produce; "
+        f"{rep.kills} vermin slain for {rep.gold}g."
+    )
+
+
+def _dispatch(gs: GameState, raw: str) -> Tuple[str, bool]:
+    # Idle gains are paid at the rates they accrued under, so settle them before
+    # a command that can change attack or crop yield (progress is split-invariant).
+    note = _settle(gs) if raw.split()[0].lower().lstrip("!") in _RATE_COMMANDS else None
+    msg, done = _command(gs, raw)
+    return (f"{note}\n{msg}" if note else msg, done)
+
+
+def _command(gs: GameState, raw: str) -> Tuple[str, bool]:
     cmd, *args = raw.strip().split()
     cmd = cmd.lower()
     if cmd in {"quit", "exit"}:
@@ -43,21 +175,29 @@ def dispatch(gs: GameState, raw: str) -> Tuple[str, bool]:
     if cmd in {"help", "!help"}:
         return (help_text(), False)
     if cmd in {"stats", "!stats"}:
+        from .skilltree import effective_stats
+
         p = gs.player
-        return (f"{p.name}: HP {p.hp}/{p.max_hp}, ATK {p.attack}, DEF {p.defense}, GOLD {p.gold}", False)
+        atk, dfn = effective_stats(p)
+        return (f"{p.name}: HP {p.hp}/{p.max_hp}, ATK {atk}, DEF {dfn}, GOLD {p.gold}", False)
     if cmd in {"attack", "!attack"}:
         if gs.current is None or not gs.current.is_alive():
             gs.current = _spawn_monster(gs.player)
+            gs.tame_tried = False
             gs.discovered.add(gs.current.name)
         m = gs.current
-        out1 = player_attack(gs.player, m)
+        hz = _hazard_here(gs)
+        out1 = player_attack(gs.player, m, hz)
         if m.is_alive():
-            out2 = monster_attack(gs.player, m)
+            out2 = monster_attack(gs.player, m, hz)
             return (out1 + "\n" + out2, False)
         return (out1, False)
     if cmd in {"fish", "!fish"}:
+        from . import content
+
+        fish = content.get().fish
         rng = rng_for(gs.player.id, "fish")
-        found = ["a bone hook", "a tangle of hair", "a pale minnow", "nothing"][rng.randint(0, 3)]
+        found = fish[rng.randint(0, len(fish) - 1)]
         return (f"You cast into black water and pull up {found}.", False)
     if cmd in {"inv", "!inv"}:
         # Show inventory with simple grouping: boxes first, then items
@@ -101,8 +241,11 @@ def dispatch(gs: GameState, raw: str) -> Tuple[str, bool]:
                 raise RuntimeError
             return (text, False)
         except Exception:
+            from . import content
+
+            epithets = content.get().bestiary_epithets
             r = rng_for("bestiary", name)
-            ep = ["bane of gutters", "slinking carrion", "ashen skulker", "rat-king's churl", "gutter shade"][r.randint(0, 4)]
+            ep = epithets[r.randint(0, len(epithets) - 1)]
             return (f"{name}\n{ep}", False)
     if cmd in {"shop", "!shop"}:
         from .loot import shop_offers
@@ -132,11 +275,16 @@ def dispatch(gs: GameState, raw: str) -> Tuple[str, bool]:
             nx, ny = x + dx, y + dy
             if in_bounds(nx, ny, gs.map_size):
                 exits.append(k)
-        return (f"{z.name} [{z.biome} t{z.tier}] Exits: {', '.join(exits) if exits else '(none)'}", False)
+        hz = _hazard_here(gs)
+        return (
+            f"{z.name} [{z.biome} t{z.tier}] Exits: {', '.join(exits) if exits else '(none)'}\n"
+            f"Weather: {hz.name}. {hz.note}",
+            False,
+        )
     if cmd in {"map", "!map"}:
         from .map import render_map
 
-        return (render_map(gs.player.id, gs.map_size, gs.pos), False)
+        return (render_map(gs.player.id, gs.map_size, gs.pos) + f"\nWeather here: {_hazard_here(gs).name}", False)
     if cmd in {"travel", "!travel"}:
         if not args:
             return ("Travel where? Try: travel n|s|e|w", False)
@@ -152,6 +300,9 @@ def dispatch(gs: GameState, raw: str) -> Tuple[str, bool]:
             return ("You cannot travel further that way.", False)
         gs.pos = (nx, ny)
         gs.visited.add(gs.pos)
+        hz = _hazard_here(gs)
+        if hz.attack or hz.defense:
+            return (f"You pick your way through the waste... {hz.note}", False)
         return ("You pick your way through the waste...", False)
     if cmd in {"buy", "!buy"}:
         if gs.shop_cache is None:
@@ -169,9 +320,9 @@ def dispatch(gs: GameState, raw: str) -> Tuple[str, bool]:
             return ("You cannot afford that.", False)
         gs.player.gold -= box.price
         # Represent lootboxes in inventory as items with a marker
-        gs.player.inventory.append(
-            type("_LootItem", (object,), {"name": f"[BOX] {box.name}", "_box_code": box.code, "_box_tier": box.tier})()
-        )
+        from .loot import box_item
+
+        gs.player.inventory.append(box_item(box.code, box.name, box.tier))
         return (f"Purchased {box.name}.", False)
     if cmd in {"open", "!open"}:
         if not args:
@@ -226,9 +377,9 @@ def dispatch(gs: GameState, raw: str) -> Tuple[str, bool]:
             return ("No such offering.", False)
         chosen = picks[idx]
         # Grant chosen lootbox
-        gs.player.inventory.append(
-            type("_LootItem", (object,), {"name": f"[BOX] {chosen.name}", "_box_code": chosen.code, "_box_tier": chosen.tier})()
-        )
+        from .loot import box_item
+
+        gs.player.inventory.append(box_item(chosen.code, chosen.name, chosen.tier))
         gs._shrine = None  # type: ignore[attr-defined]
         return (f"The altar hums. You receive a {chosen.name}.", False)
     if cmd in {"equip", "!equip"}:
@@ -300,6 +451,202 @@ def dispatch(gs: GameState, raw: str) -> Tuple[str, bool]:
                 break
         gs.player.gold += price
         return (f"Sold {chosen.name} for {price}g.", False)
+    if cmd in {"claim", "!claim"}:
+        return (_settle(gs) or "Nothing has accrued yet. Come back later.", False)
+    if cmd in {"tame", "!tame"}:
+        from .pets import tame
+
+        m = gs.current
+        if m is None or m.is_alive():
+            return ("Only a beaten beast can be tamed. Fight one first.", False)
+        if gs.tame_tried:
+            return ("The beast will not let you near again.", False)
+        gs.tame_tried = True
+        i = tame(gs.kennel, gs.player.id, m, gs.tame_attempts)
+        gs.tame_attempts += 1
+        if i is None:
+            return (f"The {m.name} snaps at your hand and slinks away.", False)
+        return (f"The {m.name} submits. You name it {gs.kennel.names[i]} (pet {i + 1}).", False)
+    if cmd in {"stable", "!stable"}:
+        k = gs.kennel
+        if not len(k):
+            return ("Your stable is empty. Beat a beast, then 'tame'.", False)
+        try:
+            page = int(args[0]) if args else 1
+        except Exception:
+            return ("Usage: stable [page]", False)
+        pages = (len(k) + PAGE_SIZE - 1) // PAGE_SIZE
+        page = max(1, min(pages, page))
+        lines = [f"Stable ({len(k)} beasts, page {page}/{pages}):"] + k.page(page, PAGE_SIZE)
+        return ("\n".join(lines), False)
+    if cmd in {"breed", "!breed"}:
+        from .pets import breed
+
+        k = gs.kennel
+        try:
+            a, b = int(args[0]) - 1, int(args[1]) - 1
+        except Exception:
+            return ("Usage: breed <petA> <petB>", False)
+        if not (0 <= a < len(k) and 0 <= b < len(k)):
+            return ("No such pet.", False)
+        try:
+            i = breed(k, gs.player.id, a, b)
+        except ValueError as e:
+            return (str(e), False)
+        return (f"{k.names[a]} and {k.names[b]} whelp {k.names[i]} (pet {i + 1}, inbreeding {k.coi[i]:.3f}).", False)
+    if cmd in {"pet", "!pet"}:
+        k = gs.kennel
+        try:
+            i = int(args[0]) - 1
+        except Exception:
+            return ("Usage: pet <n>", False)
+        if not 0 <= i < len(k):
+            return ("No such pet.", False)
+        t = k.traits_of(i)
+        parents = [k.names[p] for p in (k.sire[i], k.dam[i]) if p >= 0]
+        lines = [
+            f"{k.names[i]} the {k.species_of(i)}: " + ", ".join(f"{n} {v}" for n, v in t.items()),
+            f"Parents: {', '.join(parents) if parents else 'wild-caught'}; "
+            f"known ancestors: {len(k.ancestors(i))}; inbreeding {k.coi[i]:.3f}",
+        ]
+        return ("\n".join(lines), False)
+    if cmd in {"base", "!base"}:
+        from .basebuilding import legend
+
+        b = gs.base
+        sub = args[0].lower() if args else ""
+        if sub in {"place", "remove"}:
+            try:
+                if sub == "place":
+                    obj = args[1].lower()
+                    x, y = int(args[2]) - 1, int(args[3]) - 1
+                else:
+                    x, y = int(args[1]) - 1, int(args[2]) - 1
+            except Exception:
+                return ("Usage: base place <structure> <x> <y> | base remove <x> <y>", False)
+            try:
+                if sub == "place":
+                    gained = b.place(x, y, obj)
+                    return (f"You raise a {obj}. Bonus +{gained} (total {b.bonus}).", False)
+                obj, lost = b.remove(x, y)
+                return (f"You tear down the {obj}. Bonus -{lost} (total {b.bonus}).", False)
+            except ValueError as e:
+                return (str(e), False)
+        return (f"{b.render()}\nAdjacency bonus: {b.bonus}\n{legend()}", False)
+    if cmd in {"skills", "!skills"}:
+        from .skilltree import render
+
+        return (render(gs.player) + "\nUse 'learn <skill>' to unlock.", False)
+    if cmd in {"learn", "!learn"}:
+        from .skilltree import unlock
+
+        if not args:
+            return ("Learn which? See 'skills'.", False)
+        try:
+            node = unlock(gs.player, args[0].lower())
+        except ValueError as e:
+            return (str(e), False)
+        return (f"You learn {node.name} for {node.cost}g.", False)
+    if cmd in {"leaderboard", "!leaderboard", "top"}:
+        from .leaderboard import METRICS
+
+        metric = args[0].lower() if args else "gold"
+        if metric not in METRICS:
+            return (f"Rank by which? {', '.join(METRICS)}", False)
+        if gs.board is None:
+            return ("No leaderboard in this world.", False)
+        gs.board.record(gs)
+        lines = [f"Top {PAGE_SIZE} by {metric}:"]
+        for i, (pid, score) in enumerate(gs.board.top(metric, PAGE_SIZE), 1):
+            lines.append(f" {i}) {gs.board.names.get(pid, pid)} - {score}")
+        lines.append(f"You: #{gs.board.rank(gs.player.id, metric)} of {len(gs.board)}")
+        return ("\n".join(lines), False)
+    if cmd in {"event", "!event"}:
+        from .events import default_book, describe, start_chain
+
+        book = default_book()
+        if gs.event_node is None:
+            gs.event_node = start_chain(book, gs.player.id, gs.events_done)
+        return (describe(book, gs.event_node) + "\nUse 'choose <n>'.", False)
+    if cmd in {"choose", "!choose"}:
+        from .events import choose, default_book, describe
+
+        if gs.event_node is None:
+            return ("Nothing awaits a choice. Try 'event'.", False)
+        try:
+            n = int(args[0])
+        except Exception:
+            return ("Usage: choose <n>", False)
+        book = default_book()
+        try:
+            node, gold = choose(book, gs.event_node, n, gs.player.id, gs.events_done)
+        except ValueError as e:
+            return (str(e), False)
+        gs.player.gold = max(0, gs.player.gold + gold)
+        out = describe(book, node)
+        if gold:
+            out += f"\n({'+' if gold > 0 else ''}{gold}g)"
+        if book.is_end(node):
+            gs.event_node = None
+            gs.events_done += 1
+        else:
+            gs.event_node = node
+        return (out, False)
     if cmd in {"farm", "!farm"}:
-        return ("That system is not implemented yet in this scaffold.", False)
+        from . import farming
+
+        sub = args[0].lower() if args else ""
+        f = gs.field
+        if sub == "plant":
+            try:
+                size = int(args[1]) if len(args) > 1 else farming.DEFAULT_FIELD
+            except Exception:
+                return ("Usage: farm plant [count]", False)
+            if size < 1 or size > farming.MAX_FIELD:
+                return (f"Plant between 1 and {farming.MAX_FIELD} seeds.", False)
+            gs.field = farming.sow(gs.player.id, size, gs.clock())
+            return (f"You sow {size} seeds into the ash.", False)
+        if f is None:
+            return ("Your plot lies fallow. Use 'farm plant [count]'.", False)
+        if sub == "tend":
+            try:
+                gens = int(args[1]) if len(args) > 1 else 1
+            except Exception:
+                return ("Usage: farm tend [generations]", False)
+            now = gs.clock()
+            due = farming.tends_due(f, now)
+            if due == 0:
+                wait = farming.FARM_INTERVAL - now % farming.FARM_INTERVAL
+                return (f"The field is still growing. Next season in {int(wait // 60) + 1}m.", False)
+            gens = max(1, min(50, gens, due))
+            farming.tend(f, gens)
+            return (f"Seasons turn ({gens}). Your field is at generation {f.generation}.", False)
+        if sub == "cull":
+            trait = args[1].lower() if len(args) > 1 else ""
+            if trait not in farming.TRAITS:
+                return (f"Cull for which trait? {', '.join(farming.TRAITS)}", False)
+            n = farming.cull(f, trait)
+            return (f"You uproot {n} plants and replant from {trait} stock.", False)
+        if sub == "harvest":
+            if f.harvested == f.generation:
+                return ("Already harvested this season. Tend the field first.", False)
+            got = farming.harvest_yield(f)
+            f.harvested = f.generation
+            gs.produce += got
+            return (f"You harvest {got} produce. Stores: {gs.produce}.", False)
+        if sub == "info":
+            try:
+                j = int(args[1]) - 1
+            except Exception:
+                return ("Usage: farm info <plant>", False)
+            if j < 0 or j >= f.size:
+                return ("No such plant.", False)
+            return (f"Plant {j + 1}: {farming.genotype(f, j)}", False)
+        counts = farming.phenotypes(f)
+        traits = ", ".join(f"{t} {c}/{f.size}" for t, c in counts.items())
+        return (
+            f"Field: {f.size} plants, generation {f.generation}. {traits}. Stores: {gs.produce}.\n"
+            "Subcommands: plant [n], tend [gens], cull <trait>, harvest, info <n>",
+            False,
+        )
     return ("Unknown command. Try 'help'.", False)
@@ -0,0 +1,171 @@
+"""Game content loaded from data packs, with a compiled binary cache.
+
+Packs are TOML files: the core pack in `astrarpg/data/content`, then any
+directories listed in ASTRARPG_CONTENT_PACKS (os.pathsep-separated), each in
+filename order. Later packs replace loot entries that share a `code` and
+append to the word lists. The merged, validated result is cached with
+marshal under ASTRARPG_CACHE_DIR, keyed by a hash of every source file, so a
+cold start with unchanged packs skips TOML parsing and validation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import tomllib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..config import CACHE_DIR, CONTENT_PACKS
+
+CONTENT_DIR = Path(__file__).resolve().parents[1] / "data" / "content"
+FORMAT_VERSION = 1
+LISTS = ("biomes", "zone_adjectives", "zone_nouns", "fish", "bestiary_epithets")
+
+try:
+    from pydantic import BaseModel, Field  # type: ignore
+
+    class _LootSpec(BaseModel):
+        code: str = Field(min_length=1)
+        name: str = Field(min_length=1)
+        tier: int = Field(ge=1)
+        price: int = Field(ge=0)
+
+    class _Pack(BaseModel):
+        loot: List[_LootSpec] = Field(min_length=1)
+        biomes: List[str] = Field(min_length=1)
+        zone_adjectives: List[str] = Field(min_length=1)
+        zone_nouns: List[str] = Field(min_length=1)
+        fish: List[str] = Field(min_length=1)
+        bestiary_epithets: List[str] = Field(min_length=1)
+
+except Exception:  # pydantic not installed
+    _Pack = None  # type: ignore[assignment,misc]
+
+
+@dataclass(frozen=True)
+class Content:
+    loot: Tuple[Tuple[str, str, int, int], ...]
+    biomes: Tuple[str, ...]
+    zone_adjectives: Tuple[str, ...]
+    zone_nouns: Tuple[str, ...]
+    fish: Tuple[str, ...]
+    bestiary_epithets: Tuple[str, ...]
+
+
+def _validate(merged: Dict[str, Any]) -> None:
+    """Raise ValueError if the merged packs are malformed."""
+    if _Pack is not None:
+        _Pack.model_validate(merged)  # ValidationError subclasses ValueError
+        return
+    loot = merged.get("loot")
+    if not isinstance(loot, list) or not loot:
+        raise ValueError("content: 'loot' must be a non-empty list")
+    for entry in loot:
+        ok = (
+            isinstance(entry, dict)
+            and isinstance(entry.get("code"), str)
+            and entry["code"]
+            and isinstance(entry.get("name"), str)
+            and entry["name"]
+            and isinstance(entry.get("tier"), int)
+            and entry["tier"] >= 1
+            and isinstance(entry.get("price"), int)
+            and entry["price"] >= 0
+        )
+        if not ok:
+            raise ValueError(f"content: bad loot entry {entry!r}")
+    for key in LISTS:
+        vals = merged.get(key)
+        if not isinstance(vals, list) or not vals or not all(isinstance(v, str) for v in vals):
+            raise ValueError(f"content: {key!r} must be a non-empty list of strings")
+
+
+def _merge(packs: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    loot: Dict[str, Dict[str, Any]] = {}
+    lists: Dict[str, List[str]] = {k: [] for k in LISTS}
+    for pack in packs:
+        for entry in pack.get("loot", []):
+            code = entry.get("code") if isinstance(entry, dict) else None
+            loot[str(code)] = entry
+        for key in LISTS:
+            vals = pack.get(key, [])
+            if not isinstance(vals, list):
+                raise ValueError(f"content: {key!r} must be a list")
+            # Appended as-is: repeating an entry is how a pack weights it
+            lists[key].extend(vals)
+    return {"loot": list(loot.values()), **lists}
+
+
+def compile_packs(packs: Sequence[Dict[str, Any]]) -> tuple:
+    """Merge and validate raw packs into the plain tuple form that is cached."""
+    merged = _merge(packs)
+    _validate(merged)
+    loot = tuple((e["code"], e["name"], int(e["tier"]), int(e["price"])) for e in merged["loot"])
+    return (loot, *(tuple(merged[k]) for k in LISTS))
+
+
+def cached_compile(
+    kind: str,
+    version: int,
+    sources: Sequence[Path],
+    build: Callable[[List[bytes]], Any],
+    cache_dir: Optional[str] = CACHE_DIR,
+) -> Any:
+    """Return build(source bytes), reusing a marshal cache keyed by the sources' hash.
+
+    `build` must return marshal-able data (tuples, lists, str, bytes, ints).
+    Cache read/write failures fall back to building from source.
+    """
+    blobs = [p.read_bytes() for p in sources]
+    h = hashlib.sha256()
+    for p, blob in zip(sources, blobs):
+        h.update(p.name.encode() + b"\0" + blob + b"\0")
+    cache = Path(cache_dir) / f"{kind}-v{version}-{h.hexdigest()[:16]}.bin" if cache_dir else None
+    if cache is not None and cache.exists():
+        try:
+            return marshal.loads(cache.read_bytes())
+        except Exception:
+            pass
+    data = build(blobs)
+    if cache is not None:
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(marshal.dumps(data))
+            os.replace(tmp, cache)
+            # Caches for older sources or format versions are never read again
+            for stale in cache.parent.glob(f"{kind}-*.bin"):
+                if stale != cache:
+                    stale.unlink(missing_ok=True)
+        except (OSError, ValueError):
+            pass
+    return data
+
+
+def pack_files(dirs: Optional[Sequence[Path]] = None) -> List[Path]:
+    if dirs is None:
+        dirs = [CONTENT_DIR] + [Path(d) for d in CONTENT_PACKS.split(os.pathsep) if d]
+    files: List[Path] = []
+    for d in dirs:
+        files.extend(sorted(Path(d).glob("*.toml")))
+    return files
+
+
+def load(dirs: Optional[Sequence[Path]] = None, cache_dir: Optional[str] = CACHE_DIR) -> Content:
+    files = pack_files(dirs)
+
+    def build(blobs: List[bytes]) -> tuple:
+        return compile_packs([tomllib.loads(b.decode()) for b in blobs])
+
+    data = cached_compile("content", FORMAT_VERSION, files, build, cache_dir)
+    return Content(*data)
+
+
+@lru_cache(maxsize=1)
+def get() -> Content:
+    """Content for this process, loaded on first use."""
+    return load()
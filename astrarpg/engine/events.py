@@ -0,0 +1,184 @@
+"""Event chains: short branching narratives loaded from data files.
+
+Chains live as JSON under `astrarpg/data/events`. They are compiled once into
+flat integer-indexed tables (node text, gold, choice offsets, target indices)
+and the compiled form is cached (see `content.cached_compile`), so startup
+only reparses JSON when a chain file changes. Branches with
+several targets are resolved with `rng_for`, so outcomes are deterministic.
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..config import CACHE_DIR
+from .content import cached_compile
+from .generation import rng_for
+
+EVENTS_DIR = Path(__file__).resolve().parents[1] / "data" / "events"
+FORMAT_VERSION = 2
+
+
+class EventBook:
+    """All chains compiled into parallel arrays; nodes are global indices."""
+
+    __slots__ = (
+        "chain_ids",
+        "chain_titles",
+        "chain_start",
+        "chain_nodes",
+        "node_text",
+        "node_gold",
+        "node_choices",
+        "choice_labels",
+        "choice_targets",
+        "targets",
+    )
+
+    def __init__(self) -> None:
+        self.chain_ids: List[str] = []
+        self.chain_titles: List[str] = []
+        self.chain_start = array("i")
+        # chain i owns nodes chain_nodes[i]:chain_nodes[i+1]
+        self.chain_nodes = array("i", [0])
+        self.node_text: List[str] = []
+        self.node_gold = array("i")
+        # node i owns choices node_choices[i]:node_choices[i+1]
+        self.node_choices = array("i", [0])
+        self.choice_labels: List[str] = []
+        # choice c may lead to targets[choice_targets[c]:choice_targets[c+1]]
+        self.choice_targets = array("i", [0])
+        self.targets = array("i")
+
+    @classmethod
+    def compile(cls, chains: List[dict]) -> "EventBook":
+        book = cls()
+        for chain in chains:
+            cid = chain["id"]
+            nodes: Dict[str, dict] = chain["nodes"]
+            base = len(book.node_text)
+            index = {name: base + i for i, name in enumerate(nodes)}
+            if chain["start"] not in index:
+                raise ValueError(f"event chain {cid!r}: unknown start node {chain['start']!r}")
+            book.chain_ids.append(cid)
+            book.chain_titles.append(chain.get("title", cid))
+            book.chain_start.append(index[chain["start"]])
+            for name, node in nodes.items():
+                book.node_text.append(node["text"])
+                book.node_gold.append(int(node.get("gold", 0)))
+                for choice in node.get("choices", []):
+                    book.choice_labels.append(choice["label"])
+                    if not choice["to"]:
+                        raise ValueError(f"event chain {cid!r}: choice in {name!r} leads nowhere")
+                    for target in choice["to"]:
+                        if target not in index:
+                            raise ValueError(f"event chain {cid!r}: {name!r} points at unknown node {target!r}")
+                        book.targets.append(index[target])
+                    book.choice_targets.append(len(book.targets))
+                book.node_choices.append(len(book.choice_labels))
+            book.chain_nodes.append(len(book.node_text))
+        return book
+
+    def dump(self) -> tuple:
+        return (
+            FORMAT_VERSION,
+            self.chain_ids,
+            self.chain_titles,
+            self.chain_start.tobytes(),
+            self.node_text,
+            self.node_gold.tobytes(),
+            self.node_choices.tobytes(),
+            self.choice_labels,
+            self.choice_targets.tobytes(),
+            self.targets.tobytes(),
+            self.chain_nodes.tobytes(),
+        )
+
+    @classmethod
+    def load(cls, data: tuple) -> "EventBook":
+        if data[0] != FORMAT_VERSION:
+            raise ValueError("stale compiled event book")
+        book = cls()
+        book.chain_ids, book.chain_titles = list(data[1]), list(data[2])
+        book.node_text, book.choice_labels = list(data[4]), list(data[7])
+        for name, i in (
+            ("chain_start", 3),
+            ("node_gold", 5),
+            ("node_choices", 6),
+            ("choice_targets", 8),
+            ("targets", 9),
+            ("chain_nodes", 10),
+        ):
+            col = array("i")
+            col.frombytes(data[i])
+            setattr(book, name, col)
+        return book
+
+    def choices(self, node: int) -> range:
+        return range(self.node_choices[node], self.node_choices[node + 1])
+
+    def is_end(self, node: int) -> bool:
+        return self.node_choices[node] == self.node_choices[node + 1]
+
+    def locate(self, node: int) -> Tuple[str, int]:
+        """(chain id, offset within chain) for a node; stable across content edits elsewhere."""
+        i = bisect_right(self.chain_nodes, node) - 1
+        return self.chain_ids[i], node - self.chain_nodes[i]
+
+    def node_at(self, chain_id: str, offset: int) -> Optional[int]:
+        """Inverse of `locate`; None if the chain or node no longer exists."""
+        try:
+            i = self.chain_ids.index(chain_id)
+        except ValueError:
+            return None
+        node = self.chain_nodes[i] + offset
+        return node if 0 <= offset and node < self.chain_nodes[i + 1] else None
+
+    def resolve(self, choice: int, *seed_parts) -> int:
+        """Target node for a choice; several targets are picked by seed."""
+        lo, hi = self.choice_targets[choice], self.choice_targets[choice + 1]
+        if hi - lo == 1:
+            return self.targets[lo]
+        return self.targets[lo + rng_for(*seed_parts).randrange(hi - lo)]
+
+
+def load_book(data_dir: Path = EVENTS_DIR, cache_dir: Optional[str] = CACHE_DIR) -> EventBook:
+    """Compiled book for `data_dir`, reusing the marshal cache when sources match."""
+
+    def build(blobs: List[bytes]) -> tuple:
+        return EventBook.compile([json.loads(b) for b in blobs]).dump()
+
+    data = cached_compile("events", FORMAT_VERSION, sorted(data_dir.glob("*.json")), build, cache_dir)
+    return EventBook.load(data)
+
+
+@lru_cache(maxsize=1)
+def default_book() -> EventBook:
+    return load_book()
+
+
+def start_chain(book: EventBook, pid: str, done: int) -> int:
+    """Start node of the chain a player meets after finishing `done` chains."""
+    i = rng_for(pid, "event", done).randrange(len(book.chain_ids))
+    return book.chain_start[i]
+
+
+def describe(book: EventBook, node: int) -> str:
+    lines = [book.node_text[node]]
+    for n, c in enumerate(book.choices(node), 1):
+        lines.append(f" {n}) {book.choice_labels[c]}")
+    return "\n".join(lines)
+
+
+def choose(book: EventBook, node: int, n: int, pid: str, done: int) -> Tuple[int, int]:
+    """Take the n-th (1-based) choice at `node`; returns (next node, gold delta)."""
+    opts = book.choices(node)
+    if not 1 <= n <= len(opts):
+        raise ValueError("No such choice.")
+    nxt = book.resolve(opts[n - 1], pid, "event", done, node, n)
+    return nxt, book.node_gold[nxt]
@@ -1,3 +1,153 @@
-def farm_tick() -> str:
-    return "You tend to your meager plot; sprouts shiver in ash."
+"""Farming genetics on bit-sliced fields.
 
+A field of N plants keeps one Python int per allele slot ("plane"); bit j of
+a plane belongs to plant j. Each locus is diploid, so it has two planes.
+Crossing, mutation, culling and phenotype counts are a few big-int bitwise
+ops per locus for the whole field, not a loop over plants.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field as _field
+from typing import Dict, List, Tuple
+
+from .generation import make_seed
+from .offline import FARM_INTERVAL
+
+# (name, dominant?) per locus. Dominant traits show with one allele,
+# recessive traits need both.
+LOCI: List[Tuple[str, bool]] = [
+    ("yield", True),
+    ("hardy", True),
+    ("ashbloom", False),
+    ("thorns", True),
+]
+TRAITS = [name for name, _ in LOCI]
+
+MAX_FIELD = 8192
+DEFAULT_FIELD = 64
+MUTATION_BITS = 7  # a mutation mask is 7 random words ANDed: ~1/128 per allele
+
+
+@dataclass
+class Field:
+    size: int
+    seed: int
+    generation: int = 0
+    harvested: int = -1  # generation of the last harvest
+    planted: int = 0  # FARM_INTERVAL index when sown; one generation grows per interval
+    # planes[2*k] and planes[2*k+1] are the two allele planes of locus k
+    planes: List[int] = _field(default_factory=list)
+
+    @property
+    def full(self) -> int:
+        return (1 << self.size) - 1
+
+
+def _rot(x: int, s: int, n: int, full: int) -> int:
+    """Rotate so that bit j takes the value of bit (j + s) mod n."""
+    s %= n
+    return ((x >> s) | (x << (n - s))) & full
+
+
+def _sparse(rng: random.Random, n: int, k: int) -> int:
+    m = rng.getrandbits(n)
+    for _ in range(k - 1):
+        m &= rng.getrandbits(n)
+    return m
+
+
+def sow(pid: str, size: int = DEFAULT_FIELD, now: float = 0.0) -> Field:
+    """Plant a fresh field at time `now`; starting alleles are ~25% favourable.
+
+    Seedlings are not harvestable until the field has been tended once.
+    """
+    size = max(1, min(MAX_FIELD, size))
+    seed = make_seed(pid, "farm", size)
+    rng = random.Random(make_seed(seed, "sow"))
+    planes = [rng.getrandbits(size) & rng.getrandbits(size) for _ in range(2 * len(LOCI))]
+    return Field(size=size, seed=seed, harvested=0, planted=int(now // FARM_INTERVAL), planes=planes)
+
+
+def tends_due(f: Field, now: float) -> int:
+    """Generations the field may still be tended: one per FARM_INTERVAL since sowing."""
+    return max(0, int(now // FARM_INTERVAL) - f.planted - f.generation)
+
+
+def tend(f: Field, generations: int = 1) -> None:
+    """Advance the field: every plant crosses with its right-hand neighbour."""
+    n, full = f.size, f.full
+    for _ in range(generations):
+        rng = random.Random(make_seed(f.seed, "tend", f.generation))
+        shift = 1 + rng.randrange(max(1, n - 1)) if n > 1 else 0
+        out: List[int] = []
+        for k in range(len(LOCI)):
+            a0, a1 = f.planes[2 * k], f.planes[2 * k + 1]
+            b0, b1 = _rot(a0, shift, n, full), _rot(a1, shift, n, full)
+            pick_a, pick_b = rng.getrandbits(n), rng.getrandbits(n)
+            # One gamete from each parent: choose one of its two alleles per plant
+            g_a = (a0 & pick_a) | (a1 & ~pick_a & full)
+            g_b = (b0 & pick_b) | (b1 & ~pick_b & full)
+            out.append(g_a ^ _sparse(rng, n, MUTATION_BITS))
+            out.append(g_b ^ _sparse(rng, n, MUTATION_BITS))
+        f.planes = out
+        f.generation += 1
+
+
+def expressed(f: Field, trait: str) -> int:
+    """Bitmask of plants that show `trait`."""
+    k = TRAITS.index(trait)
+    a0, a1 = f.planes[2 * k], f.planes[2 * k + 1]
+    return (a0 | a1) if LOCI[k][1] else (a0 & a1)
+
+
+def phenotypes(f: Field) -> Dict[str, int]:
+    return {t: expressed(f, t).bit_count() for t in TRAITS}
+
+
+def cull(f: Field, trait: str, reach: int = 8) -> int:
+    """Uproot plants lacking `trait`, replanting from nearby carriers.
+
+    Returns how many plants were replaced.
+    """
+    n, full = f.size, f.full
+    keep = expressed(f, trait)
+    if keep == 0:
+        return 0
+    replaced = 0
+    for s in range(1, min(reach, n - 1) + 1):
+        fill = ~keep & _rot(keep, s, n, full) & full
+        if not fill:
+            continue
+        f.planes = [(p & ~fill) | (_rot(p, s, n, full) & fill) for p in f.planes]
+        keep |= fill
+        replaced += fill.bit_count()
+        if keep == full:
+            break
+    return replaced
+
+
+def harvest_yield(f: Field) -> int:
+    """Produce from one harvest. Hardy or thorny crops shrug off blight; ashbloom is prized."""
+    crop = expressed(f, "yield")
+    guarded = expressed(f, "hardy") | expressed(f, "thorns")
+    bloom = expressed(f, "ashbloom")
+    return 2 * (crop & guarded).bit_count() + (crop & ~guarded).bit_count() + 3 * bloom.bit_count()
+
+
+def cycle_yield(f: Field, base: int) -> int:
+    """Offline produce per crop cycle: `base` scaled by the field's output."""
+    return base + harvest_yield(f) // 16
+
+
+def genotype(f: Field, j: int) -> str:
+    """Allele pairs for plant j, e.g. 'Yy Hh aa Tt' (uppercase = favourable)."""
+    parts = []
+    for k, name in enumerate(TRAITS):
+        c = name[0]
+        a = (f.planes[2 * k] >> j) & 1
+        b = (f.planes[2 * k + 1] >> j) & 1
+        hi, lo = sorted((a, b), reverse=True)
+        parts.append((c.upper() if hi else c) + (c.upper() if lo else c))
+    return " ".join(parts)
@@ -1,9 +1,17 @@
 import hashlib
 import random
-from typing import Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+# World (e.g. a Discord guild) whose seeds are being derived; "" is the shared default world
+_WORLD: ContextVar[str] = ContextVar("astrarpg_world", default="")
 
 
 def make_seed(*parts: Any) -> int:
+    world = _WORLD.get()
+    if world:
+        parts = ("world", world, *parts)
     s = ":".join(map(str, parts))
     return int(hashlib.sha256(s.encode()).hexdigest()[:16], 16)
 
@@ -11,3 +19,12 @@ def make_seed(*parts: Any) -> int:
 def rng_for(*parts: Any) -> random.Random:
     return random.Random(make_seed(*parts))
 
+
+@contextmanager
+def in_world(world: str) -> Iterator[None]:
+    """Mix `world` into every seed derived in this context (thread/task)."""
+    token = _WORLD.set(world)
+    try:
+        yield
+    finally:
+        _WORLD.reset(token)
@@ -0,0 +1,101 @@
+"""Zone hazards (weather, darkness) shared by everyone in a region.
+
+A hazard depends only on the chunk a zone falls in and the current time
+bucket, so every player standing in the same chunk sees (and reuses) the
+same cached roll. Shortly before a bucket rolls over, the cache rolls the
+next bucket for every chunk that is in use, so the switch costs each player
+only a dict lookup.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from .generation import rng_for
+
+CHUNK = 4  # zones per chunk edge
+BUCKET_SECONDS = 900  # weather shifts every 15 minutes
+PREFETCH_LEAD = 60  # seconds before a rollover to roll the next bucket
+
+
+@dataclass(frozen=True)
+class Hazard:
+    name: str
+    attack: int  # added to the player's swing
+    defense: int  # added to the player's defense
+    note: str
+
+
+# (hazard, weight)
+KINDS = [
+    (Hazard("clear", 0, 0, "The air hangs still."), 6),
+    (Hazard("ashfall", 0, -1, "Ash sifts down and clogs every joint."), 2),
+    (Hazard("darkness", -1, 0, "A lightless hour; you swing half-blind."), 2),
+    (Hazard("fog", -1, 1, "Fog swallows blades and fangs alike."), 2),
+    (Hazard("blood moon", 1, -1, "A red moon stirs the blood."), 1),
+]
+_TOTAL = sum(w for _, w in KINDS)
+
+
+def chunk_of(x: int, y: int) -> Tuple[int, int]:
+    return (x // CHUNK, y // CHUNK)
+
+
+def bucket_of(ts: float) -> int:
+    return int(ts // BUCKET_SECONDS)
+
+
+def roll(cx: int, cy: int, bucket: int) -> Hazard:
+    r = rng_for("hazard", cx, cy, bucket).randrange(_TOTAL)
+    for h, w in KINDS:
+        if r < w:
+            return h
+        r -= w
+    return KINDS[0][0]
+
+
+class HazardCache:
+    """Hazards keyed by (chunk, bucket); older buckets are dropped on rollover."""
+
+    def __init__(self) -> None:
+        self._cache: Dict[Tuple[int, int, int], Hazard] = {}
+        self._bucket: Optional[int] = None
+        self._prefetched: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, x: int, y: int, now: float) -> Hazard:
+        cx, cy = chunk_of(x, y)
+        b = bucket_of(now)
+        if b != self._bucket:
+            self._advance(b)
+        h = self._cache.get((cx, cy, b))
+        if h is None:
+            h = self._cache[(cx, cy, b)] = roll(cx, cy, b)
+        if (b + 1) * BUCKET_SECONDS - now <= PREFETCH_LEAD and self._prefetched != b:
+            self._prefetch(b)
+        return h
+
+    def _advance(self, b: int) -> None:
+        with self._lock:
+            if self._bucket is not None and b <= self._bucket:
+                return
+            self._bucket = b
+            self._cache = {k: v for k, v in self._cache.items() if k[2] >= b}
+
+    def _prefetch(self, b: int) -> None:
+        with self._lock:
+            if self._prefetched == b:
+                return
+            self._prefetched = b
+            chunks = {(cx, cy) for cx, cy, kb in self._cache if kb == b}
+            for cx, cy in chunks:
+                self._cache.setdefault((cx, cy, b + 1), roll(cx, cy, b + 1))
+
+
+# Default cache shared by every GameState in this process
+HAZARDS = HazardCache()
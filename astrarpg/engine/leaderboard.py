@@ -0,0 +1,176 @@
+"""Leaderboards kept current as players act.
+
+Each metric has a bucketed sorted list of (-score, player_id) keys: updates
+bisect into one small bucket (O(log n) search, short memmove), and the top k
+are read straight off the front. Scores are refreshed after the commands
+that can change them, so ranking never scans every GameState.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+METRICS = ("gold", "power", "bestiary", "explored")
+
+Key = Tuple[int, str]
+
+
+class SortedScores:
+    """Minimal sorted multiset of keys split into buckets of ~`load` items."""
+
+    __slots__ = ("_buckets", "_maxes", "_load", "_len")
+
+    def __init__(self, load: int = 512):
+        self._buckets: List[List[Key]] = []
+        self._maxes: List[Key] = []
+        self._load = load
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, key: Key) -> None:
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._len = 1
+            return
+        i = bisect_left(self._maxes, key)
+        if i == len(self._buckets):
+            i -= 1
+            self._buckets[i].append(key)
+            self._maxes[i] = key
+        else:
+            insort(self._buckets[i], key)
+        self._len += 1
+        b = self._buckets[i]
+        if len(b) > 2 * self._load:
+            half = b[self._load :]
+            del b[self._load :]
+            self._maxes[i] = b[-1]
+            self._buckets.insert(i + 1, half)
+            self._maxes.insert(i + 1, half[-1])
+
+    def remove(self, key: Key) -> None:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            raise KeyError(key)
+        b = self._buckets[i]
+        j = bisect_left(b, key)
+        if j == len(b) or b[j] != key:
+            raise KeyError(key)
+        del b[j]
+        self._len -= 1
+        if not b:
+            del self._buckets[i]
+            del self._maxes[i]
+        elif j == len(b):
+            self._maxes[i] = b[-1]
+
+    def rank(self, key: Key) -> int:
+        """0-based position of `key` (walks bucket sizes, not items)."""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return self._len
+        return sum(len(b) for b in self._buckets[:i]) + bisect_left(self._buckets[i], key)
+
+    def head(self, k: int) -> Iterator[Key]:
+        for b in self._buckets:
+            for key in b:
+                if k <= 0:
+                    return
+                yield key
+                k -= 1
+
+
+class Leaderboard:
+    """Scores per metric; safe to share between threads dispatching for different players."""
+
+    def __init__(self) -> None:
+        self._scores: Dict[str, Dict[str, int]] = {m: {} for m in METRICS}
+        self._sorted: Dict[str, SortedScores] = {m: SortedScores() for m in METRICS}
+        self.names: Dict[str, str] = {}
+        # Players whose scores changed since the last drain (for batched DB writes)
+        self.dirty: Set[str] = set()
+        # One board serves many players, each dispatched under only its own GameState lock
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def update(self, pid: str, metric: str, score: int) -> None:
+        with self._lock:
+            scores = self._scores[metric]
+            old = scores.get(pid)
+            if old == score:
+                return
+            ss = self._sorted[metric]
+            if old is not None:
+                ss.remove((-old, pid))
+            scores[pid] = score
+            ss.add((-score, pid))
+            self.dirty.add(pid)
+
+    def score(self, pid: str, metric: str) -> Optional[int]:
+        return self._scores[metric].get(pid)
+
+    def top(self, metric: str, k: int = 10) -> List[Tuple[str, int]]:
+        with self._lock:
+            return [(pid, -neg) for neg, pid in self._sorted[metric].head(k)]
+
+    def rank(self, pid: str, metric: str) -> Optional[int]:
+        """1-based rank, or None if the player has no score."""
+        with self._lock:
+            s = self._scores[metric].get(pid)
+            if s is None:
+                return None
+            return self._sorted[metric].rank((-s, pid)) + 1
+
+    def record(self, gs, power: bool = True) -> None:
+        """Refresh a player's scores from their state.
+
+        Gold and counts are O(1); item power sums the inventory, so callers
+        pass power=False when the inventory cannot have changed.
+        """
+        p = gs.player
+        pid = p.id
+        # Summed before taking the board lock; the caller holds this player's lock
+        ip = item_power(p) if power or self.score(pid, "power") is None else None
+        with self._lock:
+            self.names[pid] = p.name
+            self.update(pid, "gold", p.gold)
+            self.update(pid, "bestiary", len(gs.discovered))
+            self.update(pid, "explored", len(gs.visited))
+            if ip is not None:
+                self.update(pid, "power", ip)
+
+    def rows(self, pids) -> List[Dict[str, object]]:
+        out = []
+        with self._lock:
+            for pid in pids:
+                row: Dict[str, object] = {"player_id": pid, "name": self.names.get(pid, pid)}
+                for m in METRICS:
+                    row[m] = self._scores[m].get(pid, 0)
+                out.append(row)
+        return out
+
+    def drain_dirty(self) -> List[Dict[str, object]]:
+        """Rows for every player changed since the last drain, then clear the set."""
+        with self._lock:
+            rows = self.rows(sorted(self.dirty))
+            self.dirty.clear()
+        return rows
+
+
+def item_power(player) -> int:
+    total = sum(getattr(it, "power", 0) for it in player.inventory)
+    for it in (player.equipped_weapon, player.equipped_armor):
+        if it is not None:
+            total += it.power
+    return total
+
+
+# Default board shared by every GameState in this process
+BOARD = Leaderboard()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple
 
+from . import content
 from .generation import rng_for
 from .models import Item, Player
 
@@ -15,21 +17,15 @@ class LootBox:
     price: int
 
 
-# A small pool to start; expand easily
-POOL: List[LootBox] = [
-    LootBox("copper", "Copper Cache", 1, 5),
-    LootBox("tin", "Tin Trove", 1, 9),
-    LootBox("iron", "Iron Hoard", 2, 20),
-    LootBox("silver", "Silver Reliquary", 2, 35),
-    LootBox("gold", "Gilded Reliquary", 3, 60),
-    LootBox("obs", "Obsidian Reliquary", 3, 90),
-    LootBox("myth", "Mythril Reliquary", 4, 140),
-    LootBox("eld", "Elder Reliquary", 5, 220),
-    LootBox("abyss", "Abyssal Reliquary", 6, 360),
-    LootBox("void", "Void Reliquary", 7, 580),
-    LootBox("star", "Starborn Reliquary", 8, 900),
-    LootBox("apex", "Apex Reliquary", 9, 1400),
-]
+@lru_cache(maxsize=1)
+def pool() -> Tuple[LootBox, ...]:
+    """Boxes from the content packs (see content.py), loaded on first use."""
+    return tuple(LootBox(*row) for row in content.get().loot)
+
+
+def box_item(code: str, name: str, tier: int):
+    """Inventory stand-in for an unopened lootbox ('[BOX] <name>')."""
+    return type("_LootItem", (object,), {"name": f"[BOX] {name}", "_box_code": code, "_box_tier": tier})()
 
 
 def shop_offers(pid: str, cycle: str = "daily") -> List[LootBox]:
@@ -40,11 +36,12 @@ def shop_offers(pid: str, cycle: str = "daily") -> List[LootBox]:
     r = rng_for("shop", pid, cycle)
     count = 1 + r.randint(0, 2)  # 1..3
     # Select distinct boxes
-    idxs = list(range(len(POOL)))
+    boxes = pool()
+    idxs = list(range(len(boxes)))
     picks: List[LootBox] = []
     for _ in range(count):
         i = r.randint(0, len(idxs) - 1)
-        picks.append(POOL[idxs.pop(i)])
+        picks.append(boxes[idxs.pop(i)])
     # Sort by price for stable display order
     picks.sort(key=lambda b: b.price)
     return picks
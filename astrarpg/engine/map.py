@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Tuple, List
 
+from . import content
 from .generation import rng_for
 
 
@@ -12,19 +13,6 @@ DIRS = {
 }
 
 
-BIOMES = [
-    "wastes",
-    "fen",
-    "heath",
-    "moor",
-    "ashwood",
-    "saltplain",
-]
-
-ADJ = ["ashen", "bleak", "sodden", "howling", "salt-bitten", "ironbound"]
-NOUN = ["barrow", "copse", "ridge", "sink", "trace", "glen", "cut"]
-
-
 @dataclass(frozen=True)
 class Zone:
     x: int
@@ -45,10 +33,13 @@ def in_bounds(x: int, y: int, size: Tuple[int, int]) -> bool:
 
 
 def zone_for(pid: str, x: int, y: int) -> Zone:
+    # Word lists come from the content packs (see content.py), loaded on first use
+    c = content.get()
     r = rng_for("zone", pid, x, y)
-    biome = BIOMES[r.randint(0, len(BIOMES) - 1)]
+    biome = c.biomes[r.randint(0, len(c.biomes) - 1)]
     tier = 1 + (abs(x) + abs(y)) // 2
-    name = f"{ADJ[r.randint(0, len(ADJ) - 1)]} {NOUN[r.randint(0, len(NOUN) - 1)]}"
+    adj, noun = c.zone_adjectives, c.zone_nouns
+    name = f"{adj[r.randint(0, len(adj) - 1)]} {noun[r.randint(0, len(noun) - 1)]}"
     return Zone(x=x, y=y, name=name, biome=biome, tier=tier)
 
 
@@ -71,6 +62,6 @@ def render_map(pid: str, size: Tuple[int, int], pos: Tuple[int, int]) -> str:
                 mark = z.biome[0]
                 cells.append(mark)
         rows.append("".join(cells))
-    legend = "(" + ", ".join(b[0] + ":" + b for b in BIOMES) + ")"
+    legend = "(" + ", ".join(b[0] + ":" + b for b in content.get().biomes) + ")"
     return "\n".join(rows) + "\n" + legend
 
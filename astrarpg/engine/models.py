@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 
 @dataclass
@@ -20,6 +20,8 @@ class Player:
     inventory: List[Item] = field(default_factory=list)
     equipped_weapon: Optional[Item] = None
     equipped_armor: Optional[Item] = None
+    # Learned skill-tree node ids; replaced (not mutated) on unlock so it can key caches
+    skills: FrozenSet[str] = frozenset()
 
     def is_alive(self) -> bool:
         return self.hp > 0
@@ -12,3 +12,114 @@ def get_engine() -> Optional[object]:
         # SQLAlchemy not installed or misconfigured; return None to indicate unavailable
         return None
 
+
+# Every table is partitioned by world_id ("" is the default world); see engine/worlds.py.
+# Scores live in world_scores rather than the older single-world player_scores table,
+# whose one-column key cannot be extended in place; that table is left untouched.
+_SESSIONS_DDL = (
+    "CREATE TABLE IF NOT EXISTS world_sessions "
+    "(world_id TEXT NOT NULL, player_id TEXT NOT NULL, data BLOB NOT NULL, PRIMARY KEY (world_id, player_id))"
+)
+
+
+def ensure_scores_schema(engine) -> None:
+    """Score table with one descending index per leaderboard metric, within each world."""
+    from sqlalchemy import text  # type: ignore
+
+    from .leaderboard import METRICS
+
+    cols = ", ".join(f"{m} INTEGER NOT NULL DEFAULT 0" for m in METRICS)
+    with engine.begin() as c:
+        c.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS world_scores (world_id TEXT NOT NULL DEFAULT '', player_id TEXT NOT NULL, "
+                f"name TEXT NOT NULL, {cols}, PRIMARY KEY (world_id, player_id))"
+            )
+        )
+        for m in METRICS:
+            c.execute(
+                text(f"CREATE INDEX IF NOT EXISTS ix_world_scores_{m} ON world_scores (world_id, {m} DESC, player_id)")
+            )
+
+
+def save_scores(engine, rows, world: str = "") -> None:
+    """Upsert leaderboard rows (e.g. from Leaderboard.drain_dirty) in one transaction."""
+    if not rows:
+        return
+    from sqlalchemy import text  # type: ignore
+
+    from .leaderboard import METRICS
+
+    cols = ["world_id", "player_id", "name", *METRICS]
+    sql = (
+        f"INSERT INTO world_scores ({', '.join(cols)}) VALUES ({', '.join(':' + c for c in cols)}) "
+        f"ON CONFLICT(world_id, player_id) DO UPDATE SET {', '.join(f'{c}=excluded.{c}' for c in cols[2:])}"
+    )
+    with engine.begin() as c:
+        c.execute(text(sql), [{**r, "world_id": world} for r in rows])
+
+
+def top_scores(engine, metric: str, k: int = 10, world: str = ""):
+    """Top k (player_id, name, score) rows for a metric in one world, served by its index."""
+    from sqlalchemy import text  # type: ignore
+
+    from .leaderboard import METRICS
+
+    if metric not in METRICS:
+        raise ValueError(f"unknown metric: {metric}")
+    with engine.connect() as c:
+        rows = c.execute(
+            text(
+                f"SELECT player_id, name, {metric} FROM world_scores WHERE world_id=:world "
+                f"ORDER BY {metric} DESC, player_id LIMIT :k"
+            ),
+            {"world": world, "k": k},
+        ).all()
+    return [tuple(r) for r in rows]
+
+
+def load_leaderboard(engine, board=None, world: str = ""):
+    """Warm an in-memory Leaderboard from one world's rows of the score table."""
+    from sqlalchemy import text  # type: ignore
+
+    from .leaderboard import METRICS, Leaderboard
+
+    board = board if board is not None else Leaderboard()
+    with engine.connect() as c:
+        result = c.execute(
+            text(f"SELECT player_id, name, {', '.join(METRICS)} FROM world_scores WHERE world_id=:world"),
+            {"world": world},
+        )
+        for row in result:
+            pid, name = row[0], row[1]
+            board.names[pid] = name
+            for m, v in zip(METRICS, row[2:]):
+                board.update(pid, m, int(v))
+    board.dirty.clear()
+    return board
+
+
+def save_world(engine, world: str, blobs) -> None:
+    """Replace a world's saved sessions with {player_id: snapshot bytes} in one transaction."""
+    from sqlalchemy import text  # type: ignore
+
+    with engine.begin() as c:
+        c.execute(text(_SESSIONS_DDL))
+        c.execute(text("DELETE FROM world_sessions WHERE world_id=:world"), {"world": world})
+        if blobs:
+            c.execute(
+                text("INSERT INTO world_sessions (world_id, player_id, data) VALUES (:world, :pid, :data)"),
+                [{"world": world, "pid": pid, "data": data} for pid, data in blobs.items()],
+            )
+
+
+def load_world(engine, world: str):
+    """All saved sessions of one world as {player_id: snapshot bytes}."""
+    from sqlalchemy import text  # type: ignore
+
+    with engine.begin() as c:
+        c.execute(text(_SESSIONS_DDL))
+        rows = c.execute(
+            text("SELECT player_id, data FROM world_sessions WHERE world_id=:world"), {"world": world}
+        ).all()
+    return {pid: bytes(data) for pid, data in rows}
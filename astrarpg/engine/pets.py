@@ -1,3 +1,198 @@
-def tame() -> str:
-    return "A skulking stray eyes you warily. Perhaps, one day."
+"""Pet taming and breeding.
 
+A Kennel stores pets column-wise in fixed-width arrays: parents, a packed
+uint32 of four 8-bit traits, a species index and the inbreeding coefficient
+fixed at birth. Parents always have a lower index than their young, which
+keeps the pedigree a DAG that the kinship recursion can walk youngest-first.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from .generation import rng_for
+from .models import Monster
+
+TRAITS = ("vigor", "ferocity", "loyalty", "hue")
+NO_PARENT = -1
+# Kinship/inbreeding looks back this many generations (breeders' usual 6-gen COI)
+GENERATIONS = 6
+
+_SYLLABLES = ["ash", "grim", "mor", "vel", "skar", "nox", "ul", "bri", "kath", "sol"]
+_MAGIC = b"KNL1"
+_HEADER = struct.Struct("<4sI")
+_KIN_MEMO_LIMIT = 200_000
+
+
+def pack_traits(values: Tuple[int, int, int, int]) -> int:
+    out = 0
+    for i, v in enumerate(values):
+        out |= (max(0, min(255, v)) & 0xFF) << (8 * i)
+    return out
+
+
+def unpack_traits(packed: int) -> Tuple[int, int, int, int]:
+    return tuple((packed >> (8 * i)) & 0xFF for i in range(4))  # type: ignore[return-value]
+
+
+def _pet_name(rng) -> str:
+    return (rng.choice(_SYLLABLES) + rng.choice(_SYLLABLES)).capitalize()
+
+
+class Kennel:
+    __slots__ = ("species_names", "_species_ix", "species", "sire", "dam", "traits", "coi", "names", "_kin")
+
+    def __init__(self) -> None:
+        self.species_names: List[str] = []
+        self._species_ix: Dict[str, int] = {}
+        self.species = array("H")
+        self.sire = array("i")
+        self.dam = array("i")
+        self.traits = array("I")
+        self.coi = array("d")
+        self.names: List[str] = []
+        self._kin: Dict[Tuple[int, int, int], float] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, species: str, traits: int, sire: int = NO_PARENT, dam: int = NO_PARENT) -> int:
+        ix = self._species_ix.get(species)
+        if ix is None:
+            ix = self._species_ix[species] = len(self.species_names)
+            self.species_names.append(species)
+        coi = self.kinship(sire, dam) if sire >= 0 and dam >= 0 else 0.0
+        self.species.append(ix)
+        self.sire.append(sire)
+        self.dam.append(dam)
+        self.traits.append(traits)
+        self.coi.append(coi)
+        self.names.append(name)
+        return len(self.names) - 1
+
+    def species_of(self, i: int) -> str:
+        return self.species_names[self.species[i]]
+
+    def traits_of(self, i: int) -> Dict[str, int]:
+        return dict(zip(TRAITS, unpack_traits(self.traits[i])))
+
+    def kinship(self, a: int, b: int, depth: int = GENERATIONS) -> float:
+        """Coefficient of kinship between two pets, looking back `depth` generations."""
+        if a < 0 or b < 0 or depth < 0:
+            return 0.0
+        if a == b:
+            return 0.5 * (1.0 + self.coi[a])
+        if a < b:
+            a, b = b, a
+        key = (a, b, depth)
+        hit = self._kin.get(key)
+        if hit is not None:
+            return hit
+        s, d = self.sire[a], self.dam[a]
+        val = 0.0
+        if s >= 0 or d >= 0:
+            val = 0.5 * (self.kinship(s, b, depth - 1) + self.kinship(d, b, depth - 1))
+        if len(self._kin) >= _KIN_MEMO_LIMIT:
+            self._kin.clear()
+        self._kin[key] = val
+        return val
+
+    def ancestors(self, i: int, generations: int = GENERATIONS) -> Dict[int, int]:
+        """Ancestor index -> nearest generation distance (1 = parent)."""
+        seen: Dict[int, int] = {}
+        frontier = [i]
+        for gen in range(1, generations + 1):
+            nxt: List[int] = []
+            for x in frontier:
+                for p in (self.sire[x], self.dam[x]):
+                    if p >= 0 and p not in seen:
+                        seen[p] = gen
+                        nxt.append(p)
+            if not nxt:
+                break
+            frontier = nxt
+        return seen
+
+    def page(self, n: int, size: int = 10) -> List[str]:
+        """Listing lines for page `n` (1-based); only touches that page's rows."""
+        start = (n - 1) * size
+        lines = []
+        for i in range(max(0, start), min(len(self), start + size)):
+            v, f, l, h = unpack_traits(self.traits[i])
+            lines.append(f" {i + 1}) {self.names[i]} the {self.species_of(i)} [VIG {v} FER {f} LOY {l} HUE {h}]")
+        return lines
+
+    def to_bytes(self) -> bytes:
+        cols = [self.species, self.sire, self.dam, self.traits, self.coi]
+        if sys.byteorder == "big":
+            cols = [array(c.typecode, c) for c in cols]
+            for c in cols:
+                c.byteswap()
+        species = "\0".join(self.species_names).encode()
+        names = "\0".join(self.names).encode()
+        parts = [_HEADER.pack(_MAGIC, len(self)), struct.pack("<II", len(species), len(names)), species, names]
+        parts.extend(c.tobytes() for c in cols)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Kennel":
+        view = memoryview(data)
+        magic, count = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("not a kennel snapshot")
+        off = _HEADER.size
+        ls, ln = struct.unpack_from("<II", view, off)
+        off += 8
+        k = cls()
+        k.species_names = bytes(view[off : off + ls]).decode().split("\0") if ls else []
+        off += ls
+        k.names = bytes(view[off : off + ln]).decode().split("\0") if count else []
+        off += ln
+        k._species_ix = {s: i for i, s in enumerate(k.species_names)}
+        for col in (k.species, k.sire, k.dam, k.traits, k.coi):
+            nbytes = count * col.itemsize
+            col.frombytes(view[off : off + nbytes])
+            if sys.byteorder == "big":
+                col.byteswap()
+            off += nbytes
+        return k
+
+
+def tame(kennel: Kennel, pid: str, monster: Monster, attempt: int = 0) -> Optional[int]:
+    """Try to tame a defeated beast; returns the new pet's index or None.
+
+    `attempt` counts the player's taming tries, so a failed roll is not
+    repeated on the next (identical) beast.
+    """
+    r = rng_for(pid, "tame", monster.name, len(kennel), attempt)
+    if r.randint(0, 99) >= 45:
+        return None
+    traits = pack_traits(
+        (
+            8 + monster.tier * 4 + r.randint(0, 8),
+            monster.attack * 6 + r.randint(0, 8),
+            r.randint(0, 20),
+            r.randint(0, 255),
+        )
+    )
+    return kennel.add(_pet_name(r), monster.name, traits)
+
+
+def breed(kennel: Kennel, pid: str, a: int, b: int) -> int:
+    """Breed pets a and b; raises ValueError if they cannot mate."""
+    if a == b:
+        raise ValueError("A beast cannot breed with itself.")
+    if kennel.species[a] != kennel.species[b]:
+        raise ValueError("Those beasts will not mate.")
+    r = rng_for(pid, "breed", a, b, len(kennel))
+    ta, tb = unpack_traits(kennel.traits[a]), unpack_traits(kennel.traits[b])
+    child = [(x + y) // 2 + r.randint(-4, 6) for x, y in zip(ta, tb)]
+    # Inbreeding depression hits vigor
+    depression = int(kennel.kinship(a, b) * 128)
+    child[0] -= depression
+    child[3] = ta[3] if r.randint(0, 1) else tb[3]
+    sire, dam = (a, b) if a < b else (b, a)
+    return kennel.add(_pet_name(r), kennel.species_of(a), pack_traits(tuple(child)), sire, dam)  # type: ignore[arg-type]
@@ -1,3 +1,137 @@
-def describe() -> str:
-    return "A sparse lattice of will and scars awaits unlocking."
+"""Skill tree: unlockable nodes compiled into a flat stat-modifier vector.
 
+The set of unlocked nodes (a frozenset on the Player) compiles once into
+`Modifiers`; combat asks `effective_stats` for the result instead of walking
+nodes on every swing. The ASCII grid layout is computed once per tree.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from .models import Player
+
+
+@dataclass(frozen=True)
+class SkillNode:
+    id: str
+    name: str
+    branch: int
+    tier: int
+    cost: int
+    requires: Tuple[str, ...] = ()
+    attack: int = 0
+    defense: int = 0
+    attack_pct: int = 0
+    defense_pct: int = 0
+
+
+@dataclass(frozen=True)
+class Modifiers:
+    attack: int = 0
+    defense: int = 0
+    attack_pct: int = 0
+    defense_pct: int = 0
+
+
+NODES: Dict[str, SkillNode] = {
+    n.id: n
+    for n in [
+        SkillNode("edge", "Honed Edge", 0, 1, 10, attack=1),
+        SkillNode("rend", "Rend", 0, 2, 30, ("edge",), attack=2),
+        SkillNode("fury", "Carrion Fury", 0, 3, 80, ("rend",), attack_pct=20),
+        SkillNode("hide", "Thick Hide", 1, 1, 10, defense=1),
+        SkillNode("brace", "Brace", 1, 2, 30, ("hide",), defense=2),
+        SkillNode("bulwark", "Ashen Bulwark", 1, 3, 80, ("brace",), defense_pct=25),
+        SkillNode("scar", "Scarred Will", 2, 1, 15, attack=1, defense=1),
+        SkillNode("grit", "Grit", 2, 2, 45, ("scar", "hide"), defense=1, attack_pct=10),
+        SkillNode("abyss", "Abyssal Resolve", 2, 4, 200, ("grit", "fury"), attack=3, defense=3),
+    ]
+}
+
+BRANCHES = ["Blade", "Ward", "Will"]
+
+
+@lru_cache(maxsize=1024)
+def compile_modifiers(unlocked: FrozenSet[str]) -> Modifiers:
+    atk = dfn = atk_pct = def_pct = 0
+    for nid in unlocked:
+        n = NODES[nid]
+        atk += n.attack
+        dfn += n.defense
+        atk_pct += n.attack_pct
+        def_pct += n.defense_pct
+    return Modifiers(atk, dfn, atk_pct, def_pct)
+
+
+def effective_stats(player: Player) -> Tuple[int, int]:
+    """(attack, defense) with equipment (already in the base stats) and skills applied."""
+    m = compile_modifiers(player.skills)
+    atk = (player.attack + m.attack) * (100 + m.attack_pct) // 100
+    dfn = (player.defense + m.defense) * (100 + m.defense_pct) // 100
+    return atk, dfn
+
+
+def _missing(player: Player, n: SkillNode) -> List[str]:
+    return [r for r in n.requires if r not in player.skills]
+
+
+def can_unlock(player: Player, nid: str) -> Optional[str]:
+    """None if `nid` can be learned now, else the reason it cannot."""
+    n = NODES.get(nid)
+    if n is None:
+        return "No such skill."
+    if nid in player.skills:
+        return "Already learned."
+    missing = _missing(player, n)
+    if missing:
+        return f"Requires: {', '.join(NODES[r].name for r in missing)}."
+    if player.gold < n.cost:
+        return f"Costs {n.cost}g."
+    return None
+
+
+def unlock(player: Player, nid: str) -> SkillNode:
+    reason = can_unlock(player, nid)
+    if reason is not None:
+        raise ValueError(reason)
+    n = NODES[nid]
+    player.gold -= n.cost
+    player.skills = player.skills | {nid}
+    return n
+
+
+@lru_cache(maxsize=8)
+def _layout(node_ids: Tuple[str, ...]) -> Tuple[Tuple[Tuple[Optional[str], ...], ...], int]:
+    """Grid of node ids (rows = tiers, columns = branches) and the cell width."""
+    nodes = [NODES[i] for i in node_ids]
+    rows = max(n.tier for n in nodes)
+    cols = max(n.branch for n in nodes) + 1
+    grid: List[List[Optional[str]]] = [[None] * cols for _ in range(rows)]
+    for n in nodes:
+        grid[n.tier - 1][n.branch] = n.id
+    width = max(len(n.id) + len(n.name) for n in nodes) + 8
+    return tuple(tuple(r) for r in grid), width
+
+
+def render(player: Player) -> str:
+    """ASCII tree: [x] learned, [ ] learnable now, [-] locked."""
+    grid, width = _layout(tuple(NODES))
+    lines = ["".join(b.ljust(width) for b in BRANCHES).rstrip()]
+    for row in grid:
+        cells = []
+        for nid in row:
+            if nid is None:
+                cells.append("|".ljust(width))
+                continue
+            if nid in player.skills:
+                mark = "x"
+            elif not _missing(player, NODES[nid]):
+                mark = " "
+            else:
+                mark = "-"
+            cells.append(f"[{mark}] {NODES[nid].name} ({nid})".ljust(width))
+        lines.append("".join(cells).rstrip())
+    return "\n".join(lines)
@@ -0,0 +1,314 @@
+"""Compact, versioned binary snapshots of a GameState.
+
+Layout (little-endian): header, string table, fixed player scalars, the
+smaller collections, then the inventory as fixed-width 16-byte records.
+Every string (item names, box codes, bestiary names, ...) is stored once in
+the table and referenced by index. `loads` reads through a memoryview
+without copying; the inventory stays encoded until it is first touched.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from collections.abc import MutableSequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .models import Item, Monster, Player
+
+MAGIC = b"ASNP"
+VERSION = 4
+
+_HEADER = struct.Struct("<4sHH")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_PLAYER = struct.Struct("<IIqqqqq")  # id, name, hp, max_hp, attack, defense, gold
+_EQUIP = struct.Struct("<iq")  # name index (-1 = empty), power
+_PAIR = struct.Struct("<ii")
+_BOX = struct.Struct("<IIqq")  # code, name, tier, price
+# produce, last_claim, events_done, event chain, event offset, tame_tried, tame_attempts
+_MISC = struct.Struct("<qdIiiBI")
+_FIELD = struct.Struct("<IQiiq")  # size, seed, generation, harvested, planted
+_MONSTER = struct.Struct("<IIIqqqq")  # biome, tier, name, hp, max_hp, attack, defense
+# Inventory records: kind, name index, then power (item) or code index + tier (box)
+_REC = struct.Struct("<BxxxIq")
+_BOX_REC = struct.Struct("<BxxxIIi")
+KIND_ITEM, KIND_BOX = 0, 1
+_NONE = -1
+
+
+def _le(a: array) -> bytes:
+    if sys.byteorder == "big":
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+def _from_le(typecode: str, raw: memoryview) -> array:
+    a = array(typecode)
+    a.frombytes(raw)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a
+
+
+class _Strings:
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+        self.items: List[str] = []
+
+    def __call__(self, s: str) -> int:
+        i = self.index.get(s)
+        if i is None:
+            i = self.index[s] = len(self.items)
+            self.items.append(s)
+        return i
+
+
+class _Reader:
+    __slots__ = ("view", "off")
+
+    def __init__(self, view: memoryview, off: int = 0):
+        self.view = view
+        self.off = off
+
+    def unpack(self, st: struct.Struct) -> Tuple[Any, ...]:
+        out = st.unpack_from(self.view, self.off)
+        self.off += st.size
+        return out
+
+    def u32(self) -> int:
+        return self.unpack(_U32)[0]
+
+    def take(self, n: int) -> memoryview:
+        out = self.view[self.off : self.off + n]
+        self.off += n
+        return out
+
+    def array(self, typecode: str, count: int) -> array:
+        return _from_le(typecode, self.take(count * array(typecode).itemsize))
+
+
+class LazyInventory(MutableSequence):
+    """Inventory list that decodes its snapshot records on first access.
+
+    `len()` is answered from the record count without decoding.
+    """
+
+    __slots__ = ("_view", "_strings", "_count", "_items")
+
+    def __init__(self, view: memoryview, strings: List[str], count: int):
+        self._view: Optional[memoryview] = view
+        self._strings = strings
+        self._count = count
+        self._items: Optional[List[Any]] = None
+
+    @property
+    def decoded(self) -> bool:
+        return self._items is not None
+
+    def _load(self) -> List[Any]:
+        if self._items is None:
+            from .loot import box_item
+
+            strs = self._strings
+            items: List[Any] = []
+            view = self._view
+            for n, (kind, s, v) in enumerate(_REC.iter_unpack(view)):  # type: ignore[arg-type]
+                if kind == KIND_ITEM:
+                    items.append(Item(name=strs[s], power=v))
+                else:
+                    _, _, code, tier = _BOX_REC.unpack_from(view, n * _REC.size)  # type: ignore[arg-type]
+                    items.append(box_item(strs[code], strs[s], tier))
+            self._items = items
+            self._view = None
+        return self._items
+
+    def __len__(self) -> int:
+        return self._count if self._items is None else len(self._items)
+
+    def __getitem__(self, i):
+        return self._load()[i]
+
+    def __setitem__(self, i, value) -> None:
+        self._load()[i] = value
+
+    def __delitem__(self, i) -> None:
+        del self._load()[i]
+
+    def insert(self, i: int, value: Any) -> None:
+        self._load().insert(i, value)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._load())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyInventory)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        if self._items is None:
+            return f"LazyInventory(<{self._count} encoded>)"
+        return repr(self._items)
+
+
+def dumps(gs) -> bytes:
+    """Encode a GameState (player, map, shop, bestiary and subsystems)."""
+    strs = _Strings()
+    p = gs.player
+    parts: List[bytes] = []
+
+    # Inventory first so its names are interned; it is written last.
+    inv = bytearray(_REC.size * len(p.inventory))
+    for n, it in enumerate(p.inventory):
+        if isinstance(it, Item):
+            _REC.pack_into(inv, n * _REC.size, KIND_ITEM, strs(it.name), it.power)
+        else:
+            code = strs(getattr(it, "_box_code"))
+            _BOX_REC.pack_into(inv, n * _REC.size, KIND_BOX, strs(it.name[6:]), code, getattr(it, "_box_tier"))
+
+    parts.append(_PLAYER.pack(strs(p.id), strs(p.name), p.hp, p.max_hp, p.attack, p.defense, p.gold))
+    for eq in (p.equipped_weapon, p.equipped_armor):
+        parts.append(_EQUIP.pack(strs(eq.name), eq.power) if eq is not None else _EQUIP.pack(_NONE, 0))
+    skills = array("I", [strs(s) for s in sorted(p.skills)])
+    parts += [_U32.pack(len(skills)), _le(skills)]
+
+    m = gs.current
+    if m is None:
+        parts.append(_U32.pack(0))
+    else:
+        parts += [_U32.pack(1), _MONSTER.pack(strs(m.biome), m.tier, strs(m.name), m.hp, m.max_hp, m.attack, m.defense)]
+
+    parts += [_PAIR.pack(*gs.map_size), _PAIR.pack(*gs.pos)]
+    visited = array("i", [c for xy in sorted(gs.visited) for c in xy])
+    parts += [_U32.pack(len(gs.visited)), _le(visited)]
+    discovered = array("I", [strs(s) for s in sorted(gs.discovered)])
+    parts += [_U32.pack(len(discovered)), _le(discovered)]
+
+    parts.append(_U32.pack(strs(gs.shop_cycle)))
+    if gs.shop_cache is None:
+        parts.append(_I32.pack(_NONE))
+    else:
+        parts.append(_I32.pack(len(gs.shop_cache)))
+        parts += [_BOX.pack(strs(b.code), strs(b.name), b.tier, b.price) for b in gs.shop_cache]
+
+    chain, offset = _NONE, 0
+    if gs.event_node is not None:
+        from .events import default_book
+
+        cid, offset = default_book().locate(gs.event_node)
+        chain = strs(cid)
+    parts.append(_MISC.pack(gs.produce, gs.last_claim, gs.events_done, chain, offset, gs.tame_tried, gs.tame_attempts))
+
+    f = gs.field
+    if f is None:
+        parts.append(_U32.pack(0))
+    else:
+        nbytes = (f.size + 7) // 8
+        parts += [_U32.pack(1), _FIELD.pack(f.size, f.seed, f.generation, f.harvested, f.planted)]
+        parts += [pl.to_bytes(nbytes, "little") for pl in f.planes]
+
+    b = gs.base
+    cells = array("I", [0 if c is None else strs(c) + 1 for c in b.cells])
+    parts += [_PAIR.pack(b.w, b.h), _le(cells)]
+
+    kennel = gs.kennel.to_bytes()
+    parts += [_U32.pack(len(kennel)), kennel]
+
+    parts += [_U32.pack(len(p.inventory)), bytes(inv)]
+
+    encoded = [s.encode() for s in strs.items]
+    lengths = array("I", [len(e) for e in encoded])
+    table = [_U32.pack(len(encoded)), _le(lengths), b"".join(encoded)]
+    return b"".join([_HEADER.pack(MAGIC, VERSION, 0), *table, *parts])
+
+
+def loads(data, lazy: bool = True):
+    """Decode a snapshot from bytes/bytearray/memoryview into a GameState.
+
+    With lazy=True the inventory is a LazyInventory over the caller's buffer,
+    so that buffer must not be mutated until the inventory is first used.
+    """
+    from .basebuilding import OBJECTS, Base
+    from .commands import GameState
+    from .farming import LOCI, Field
+    from .loot import LootBox
+    from .pets import Kennel
+    from .skilltree import NODES
+
+    r = _Reader(memoryview(data).cast("B"))
+    magic, version, _ = r.unpack(_HEADER)
+    if magic != MAGIC:
+        raise ValueError("not an AstraRPG snapshot")
+    if version != VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+
+    n = r.u32()
+    lengths = r.array("I", n)
+    blob = bytes(r.take(sum(lengths)))
+    strs: List[str] = []
+    pos = 0
+    for ln in lengths:
+        strs.append(blob[pos : pos + ln].decode())
+        pos += ln
+
+    pid, name, hp, max_hp, attack, defense, gold = r.unpack(_PLAYER)
+    player = Player(id=strs[pid], name=strs[name], hp=hp, max_hp=max_hp, attack=attack, defense=defense, gold=gold)
+    equipped = []
+    for _ in range(2):
+        ix, power = r.unpack(_EQUIP)
+        equipped.append(Item(name=strs[ix], power=power) if ix != _NONE else None)
+    player.equipped_weapon, player.equipped_armor = equipped
+    # Skills removed from the tree since the save are dropped rather than kept as dead ids
+    player.skills = frozenset(s for s in (strs[i] for i in r.array("I", r.u32())) if s in NODES)
+
+    gs = GameState(player)
+    if r.u32():
+        biome, tier, mname, mhp, mmax, matk, mdef = r.unpack(_MONSTER)
+        gs.current = Monster(strs[biome], tier, strs[mname], mhp, mmax, matk, mdef)
+    gs.map_size = r.unpack(_PAIR)
+    gs.pos = r.unpack(_PAIR)
+    nv = r.u32()
+    flat = r.array("i", 2 * nv)
+    gs.visited = {(flat[2 * i], flat[2 * i + 1]) for i in range(nv)}
+    gs.discovered = {strs[i] for i in r.array("I", r.u32())}
+
+    gs.shop_cycle = strs[r.u32()]
+    ncache = r.unpack(_I32)[0]
+    if ncache != _NONE:
+        gs.shop_cache = []
+        for _ in range(ncache):
+            code, bname, tier, price = r.unpack(_BOX)
+            gs.shop_cache.append(LootBox(strs[code], strs[bname], tier, price))
+
+    produce, last_claim, events_done, chain, offset, tame_tried, tame_attempts = r.unpack(_MISC)
+    gs.produce, gs.last_claim, gs.events_done = produce, last_claim, events_done
+    gs.tame_tried, gs.tame_attempts = bool(tame_tried), tame_attempts
+    if chain != _NONE:
+        from .events import default_book
+
+        gs.event_node = default_book().node_at(strs[chain], offset)
+
+    if r.u32():
+        size, seed, generation, harvested, planted = r.unpack(_FIELD)
+        nbytes = (size + 7) // 8
+        planes = [int.from_bytes(r.take(nbytes), "little") for _ in range(2 * len(LOCI))]
+        gs.field = Field(size=size, seed=seed, generation=generation, harvested=harvested, planted=planted, planes=planes)
+
+    w, h = r.unpack(_PAIR)
+    base = Base((w, h))
+    for i, c in enumerate(r.array("I", w * h)):
+        # Structures removed from the game since the save are skipped
+        if c and strs[c - 1] in OBJECTS:
+            base.place(i % w, i // w, strs[c - 1])
+    gs.base = base
+
+    gs.kennel = Kennel.from_bytes(r.take(r.u32()))
+
+    count = r.u32()
+    inv = LazyInventory(r.take(count * _REC.size), strs, count)
+    player.inventory = inv if lazy else list(inv)  # type: ignore[assignment]
+    return gs
+
@@ -0,0 +1,204 @@
+"""Isolated worlds, one per Discord guild (or other tenant).
+
+A World owns its sessions, leaderboard and hazard cache, and its id is mixed
+into every seed its players derive (see generation.in_world), so zones, loot
+and weather differ between guilds. Worlds load and unload wholesale: a
+world's sessions are saved as snapshot blobs (see snapshot.py) in one
+transaction, which lets idle guilds be evicted from memory and their work
+sharded by world id.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Mapping, Optional
+
+from .commands import GameState
+from .hazards import HazardCache
+from .leaderboard import Leaderboard
+from .models import Player
+
+log = logging.getLogger(__name__)
+
+class World:
+    def __init__(self, world_id: str, clock: Callable[[], float] = time.monotonic):
+        self.id = world_id
+        self.sessions: Dict[str, GameState] = {}
+        self.board = Leaderboard()
+        self.hazards = HazardCache()
+        self.clock = clock
+        self.last_used = clock()
+        # Guards session creation; commands for one world run on several worker threads
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def adopt(self, gs: GameState) -> GameState:
+        """Attach a state to this world's seeds, board and hazards."""
+        gs.world = self.id
+        gs.board = self.board
+        gs.hazards = self.hazards
+        self.sessions[gs.player.id] = gs
+        return gs
+
+    def session(self, pid: str, name: str) -> GameState:
+        """The player's state in this world, created on first use."""
+        self.last_used = self.clock()
+        gs = self.sessions.get(pid)
+        if gs is None:
+            with self._lock:
+                gs = self.sessions.get(pid)
+                if gs is None:
+                    gs = self.adopt(GameState(Player(id=pid, name=name)))
+                    self.board.record(gs)
+        return gs
+
+    def dump(self) -> Dict[str, bytes]:
+        """Every session as {player_id: snapshot bytes}."""
+        from .snapshot import dumps
+
+        out: Dict[str, bytes] = {}
+        for pid, gs in list(self.sessions.items()):
+            with gs.lock:
+                out[pid] = dumps(gs)
+        return out
+
+    @classmethod
+    def load(
+        cls,
+        world_id: str,
+        blobs: Mapping[str, bytes],
+        clock: Callable[[], float] = time.monotonic,
+        board: Optional[Leaderboard] = None,
+    ) -> "World":
+        """Rebuild a world from `dump` output.
+
+        Pass the world's saved `board` to keep inventories encoded until used;
+        without one, scores are recomputed from every session.
+        """
+        from .snapshot import loads
+
+        world = cls(world_id, clock)
+        if board is not None:
+            world.board = board
+        for data in blobs.values():
+            gs = world.adopt(loads(data))
+            if board is None:
+                world.board.record(gs)
+        world.board.dirty.clear()
+        return world
+
+
+class WorldRegistry:
+    """Worlds currently in memory; with a DB engine, unloads save and loads restore."""
+
+    def __init__(self, engine=None, clock: Callable[[], float] = time.monotonic):
+        self.engine = engine
+        self.clock = clock
+        self._worlds: Dict[str, World] = {}
+        # Worlds being saved by `unload`; a `get` meanwhile takes them back
+        self._unloading: Dict[str, World] = {}
+        # One lock per world id being loaded, so a cold guild only blocks itself
+        self._loading: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._worlds)
+
+    def __contains__(self, world_id: str) -> bool:
+        return world_id in self._worlds
+
+    def _take(self, world_id: str) -> Optional[World]:
+        # Caller holds _lock
+        world = self._worlds.get(world_id)
+        if world is None:
+            world = self._unloading.get(world_id)
+        if world is not None:
+            self._worlds[world_id] = world
+            world.last_used = self.clock()
+        return world
+
+    def get(self, world_id: str) -> World:
+        with self._lock:
+            world = self._take(world_id)
+            if world is not None:
+                return world
+            loading = self._loading.setdefault(world_id, threading.Lock())
+        with loading:
+            with self._lock:
+                world = self._take(world_id)
+            if world is not None:
+                return world
+            world = self._load(world_id)
+            with self._lock:
+                self._worlds[world_id] = world
+                world.last_used = self.clock()
+                self._loading.pop(world_id, None)
+            return world
+
+    def _load(self, world_id: str) -> World:
+        if self.engine is None:
+            return World(world_id, self.clock)
+        from .persistence import ensure_scores_schema, load_leaderboard, load_world
+
+        ensure_scores_schema(self.engine)
+        board = load_leaderboard(self.engine, world=world_id)
+        return World.load(world_id, load_world(self.engine, world_id), self.clock, board)
+
+    def unload(self, world_id: str, idle_since: Optional[float] = None) -> Optional[Dict[str, bytes]]:
+        """Drop a world from memory (saving it if there is an engine); returns its blobs.
+
+        With `idle_since`, the world is kept (and None returned) if it was used after that time.
+        If saving fails the world stays loaded and the error propagates.
+        """
+        with self._lock:
+            world = self._worlds.get(world_id)
+            if world is None or (idle_since is not None and world.last_used > idle_since):
+                return None
+            del self._worlds[world_id]
+            self._unloading[world_id] = world
+        rows: List[Dict[str, object]] = []
+        try:
+            blobs = world.dump()
+            if self.engine is not None:
+                from .persistence import ensure_scores_schema, save_scores, save_world
+
+                save_world(self.engine, world_id, blobs)
+                ensure_scores_schema(self.engine)
+                rows = world.board.drain_dirty()
+                save_scores(self.engine, rows, world=world_id)
+        except BaseException:
+            world.board.dirty.update(str(r["player_id"]) for r in rows)
+            with self._lock:
+                self._unloading.pop(world_id, None)
+                # A get() during the save may already have taken it back
+                self._worlds.setdefault(world_id, world)
+            raise
+        with self._lock:
+            self._unloading.pop(world_id, None)
+        return blobs
+
+    def _unload_logged(self, world_id: str, idle_since: Optional[float] = None) -> bool:
+        try:
+            return self.unload(world_id, idle_since) is not None
+        except Exception:
+            log.exception("failed to unload world %r; keeping it in memory", world_id)
+            return False
+
+    def evict_idle(self, max_idle: float) -> List[str]:
+        """Unload every world unused for `max_idle` seconds; returns their ids."""
+        cutoff = self.clock() - max_idle
+        with self._lock:
+            idle = [wid for wid, w in self._worlds.items() if w.last_used <= cutoff]
+        # Re-checked under the lock in unload: a get() since the scan keeps the world
+        # Failures are logged per world and do not stop the others
+        return [wid for wid in idle if self._unload_logged(wid, idle_since=cutoff)]
+
+    def unload_all(self) -> List[str]:
+        """Unload every world, e.g. at shutdown; returns the ids that failed to save."""
+        with self._lock:
+            ids = list(self._worlds)
+        return [wid for wid in ids if not self._unload_logged(wid)]
@@ -0,0 +1,25 @@
+"""Farming genetics: advancing whole fields per 'farm' command.
+
+Run: python -m benchmarks.bench_farming
+"""
+
+import timeit
+
+from astrarpg.engine import farming
+
+
+def main() -> None:
+    for size in (64, 1000, 4096, farming.MAX_FIELD):
+        f = farming.sow("bench", size)
+        n = 200
+        t_tend = timeit.timeit(lambda: farming.tend(f), number=n) / n
+        t_pheno = timeit.timeit(lambda: farming.phenotypes(f), number=n) / n
+        t_cull = timeit.timeit(lambda: farming.cull(farming.sow("bench", size), "hardy"), number=20) / 20
+        print(
+            f"{size:>5} plants: tend {t_tend * 1e3:6.3f} ms, "
+            f"phenotypes {t_pheno * 1e3:6.3f} ms, sow+cull {t_cull * 1e3:6.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
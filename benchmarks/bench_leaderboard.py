@@ -0,0 +1,36 @@
+"""Leaderboard: score updates and top-k reads with 1M players.
+
+Run: python -m benchmarks.bench_leaderboard
+"""
+
+import random
+import time
+
+from astrarpg.engine.leaderboard import Leaderboard
+
+
+def main() -> None:
+    n = 1_000_000
+    r = random.Random(1)
+    lb = Leaderboard()
+    t0 = time.perf_counter()
+    for i in range(n):
+        lb.update(f"p{i}", "gold", r.randrange(10**9))
+    print(f"load {n} players: {time.perf_counter() - t0:.2f}s")
+    reps = 100_000
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        lb.update(f"p{r.randrange(n)}", "gold", r.randrange(10**9))
+    print(f"update: {(time.perf_counter() - t0) / reps * 1e6:.2f} us")
+    t0 = time.perf_counter()
+    for _ in range(10_000):
+        lb.top("gold", 10)
+    print(f"top 10: {(time.perf_counter() - t0) / 10_000 * 1e6:.2f} us")
+    t0 = time.perf_counter()
+    for _ in range(1_000):
+        lb.rank(f"p{r.randrange(n)}", "gold")
+    print(f"rank: {(time.perf_counter() - t0) / 1_000 * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
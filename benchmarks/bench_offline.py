@@ -0,0 +1,26 @@
+"""Offline progression: returning after an hour vs. after a year.
+
+Run: python -m benchmarks.bench_offline
+"""
+
+import timeit
+
+from astrarpg.engine.models import Player
+from astrarpg.engine.offline import progress
+
+HOUR = 3600
+YEAR = 365 * 24 * HOUR
+
+
+def main() -> None:
+    p = Player(id="bench", name="Bench")
+    t0 = 1_700_000_000
+    for label, span in [("1 hour", HOUR), ("1 day", 24 * HOUR), ("1 year", YEAR), ("100 years", 100 * YEAR)]:
+        n = 2000
+        secs = timeit.timeit(lambda: progress(p, t0, t0 + span), number=n)
+        rep = progress(p, t0, t0 + span)
+        print(f"{label:>10}: {secs / n * 1e6:8.1f} us/claim  (kills={rep.kills}, produce={rep.produce})")
+
+
+if __name__ == "__main__":
+    main()
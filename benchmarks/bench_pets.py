@@ -0,0 +1,54 @@
+"""Pet kennels: breeding and listing with tens of thousands of pets.
+
+Run: python -m benchmarks.bench_pets
+"""
+
+import random
+import time
+
+from astrarpg.engine import pets
+
+
+def build(n: int) -> pets.Kennel:
+    k = pets.Kennel()
+    for i in range(64):
+        k.add(f"F{i}", "Carrion Rat", pets.pack_traits((40, 30, 10, i)))
+    r = random.Random(1)
+    while len(k) < n:
+        # Favour recent pets so pedigrees run deep
+        a = r.randrange(max(0, len(k) - 500), len(k))
+        b = r.randrange(max(0, len(k) - 500), len(k))
+        if a != b:
+            pets.breed(k, "bench", a, b)
+    return k
+
+
+def main() -> None:
+    for n in (1_000, 10_000, 50_000):
+        t0 = time.perf_counter()
+        k = build(n)
+        built = time.perf_counter() - t0
+        r = random.Random(2)
+        reps = 1000
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            a, b = r.randrange(len(k) - 500, len(k)), r.randrange(len(k) - 500, len(k))
+            if a != b:
+                pets.breed(k, "bench", a, b)
+        t_breed = (time.perf_counter() - t0) / reps
+        t0 = time.perf_counter()
+        for p in range(1, reps + 1):
+            k.page(p % (len(k) // 10) + 1)
+        t_page = (time.perf_counter() - t0) / reps
+        blob = k.to_bytes()
+        t0 = time.perf_counter()
+        pets.Kennel.from_bytes(blob)
+        t_load = time.perf_counter() - t0
+        print(
+            f"{n:>6} pets: build {built:5.2f}s, breed {t_breed * 1e3:6.3f} ms, "
+            f"list page {t_page * 1e3:6.3f} ms, blob {len(blob) // 1024} KiB loads in {t_load * 1e3:5.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
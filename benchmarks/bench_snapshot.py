@@ -0,0 +1,56 @@
+"""GameState snapshots vs. JSON for large inventories.
+
+Run: python -m benchmarks.bench_snapshot
+"""
+
+import json
+import time
+
+from astrarpg.engine import snapshot
+from astrarpg.engine.commands import GameState
+from astrarpg.engine.models import Item, Player
+
+
+def as_json(gs: GameState) -> str:
+    p = gs.player
+    return json.dumps(
+        {
+            "id": p.id,
+            "name": p.name,
+            "gold": p.gold,
+            "inventory": [{"name": it.name, "power": it.power} for it in p.inventory],
+            "visited": sorted(gs.visited),
+            "discovered": sorted(gs.discovered),
+        }
+    )
+
+
+def main() -> None:
+    for n in (1_000, 100_000):
+        gs = GameState(Player(id="bench", name="Bench"))
+        gs.player.inventory = [Item(f"Relic {i % 64}", i % 50) for i in range(n)]
+        t0 = time.perf_counter()
+        blob = snapshot.dumps(gs)
+        t_dump = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        restored = snapshot.loads(blob)
+        len(restored.player.inventory)
+        t_load = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        list(restored.player.inventory)
+        t_decode = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        text = as_json(gs)
+        t_jdump = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        [Item(**d) for d in json.loads(text)["inventory"]]
+        t_jload = time.perf_counter() - t0
+        print(
+            f"{n:>7} items: snapshot {len(blob) // 1024:5d} KiB dump {t_dump * 1e3:7.2f} ms "
+            f"load {t_load * 1e3:6.3f} ms (+{t_decode * 1e3:6.2f} ms on first use) | "
+            f"json {len(text) // 1024:5d} KiB dump {t_jdump * 1e3:7.2f} ms load {t_jload * 1e3:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
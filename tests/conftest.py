@@ -1,4 +1,8 @@
+import atexit
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 
@@ -7,3 +11,9 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+# Keep compiled content/event caches out of the real ~/.cache during test runs
+if not os.environ.get("ASTRARPG_CACHE_DIR"):
+    _CACHE = tempfile.mkdtemp(prefix="astrarpg-cache-")
+    os.environ["ASTRARPG_CACHE_DIR"] = _CACHE
+    atexit.register(shutil.rmtree, _CACHE, ignore_errors=True)
+
@@ -0,0 +1,63 @@
+import random
+
+from astrarpg.engine.basebuilding import OBJECTS, Base
+from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.models import Player
+
+
+def test_adjacency_bonus_incremental():
+    b = Base((5, 5))
+    assert b.place(1, 1, "forge") == 0
+    assert b.place(2, 1, "hearth") == 3
+    assert b.place(1, 2, "well") == 2
+    assert b.bonus == 5
+    obj, lost = b.remove(1, 1)
+    assert obj == "forge" and lost == 5 and b.bonus == 0
+
+
+def test_incremental_matches_recount():
+    b = Base((20, 15))
+    r = random.Random(7)
+    names = list(OBJECTS)
+    for _ in range(600):
+        x, y = r.randrange(b.w), r.randrange(b.h)
+        if b.at(x, y) is None:
+            b.place(x, y, r.choice(names))
+        else:
+            b.remove(x, y)
+        assert b.bonus == b.recount()
+
+
+def test_render_cache_tracks_changes():
+    b = Base((4, 3))
+    first = b.render()
+    assert first == "....\n....\n...."
+    assert b.render() is first
+    b.place(0, 2, "wall")
+    assert b.render().splitlines()[2] == "#..."
+    b.remove(0, 2)
+    assert b.render() == first
+
+
+def test_place_errors():
+    b = Base((3, 3))
+    for args in [(5, 5, "wall"), (0, 0, "moat")]:
+        try:
+            b.place(*args)
+        except ValueError:
+            continue
+        raise AssertionError(f"expected ValueError for {args}")
+
+
+def test_base_commands():
+    gs = GameState(Player(id="builder", name="B"))
+    msg, _ = dispatch(gs, "base place forge 1 1")
+    assert "forge" in msg
+    msg, _ = dispatch(gs, "base place hearth 2 1")
+    assert "+3" in msg
+    msg, _ = dispatch(gs, "base place well 2 1")
+    assert "already" in msg
+    msg, _ = dispatch(gs, "base")
+    assert msg.startswith("FH") and "bonus: 3" in msg
+    msg, _ = dispatch(gs, "base remove 1 1")
+    assert "-3" in msg
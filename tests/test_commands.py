@@ -1,4 +1,4 @@
-from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.commands import BATCH_LIMIT, RESPONSE_CAP, GameState, dispatch, dispatch_many
 from astrarpg.engine.models import Player
 
 
@@ -55,3 +55,28 @@ def test_shop_buy_open():
     # Opening first lootbox in inventory listing
     msg, _ = dispatch(gs, "open 1")
     assert "clicks open" in msg
+
+
+def test_dispatch_many_runs_in_order():
+    gs = make_state()
+    gs.player.gold = 1000
+    msg, done = dispatch_many(gs, ["shop", "buy 1", "open 1"])
+    assert "Shop offers" in msg and "Purchased" in msg and "clicks open" in msg
+    assert not done
+    assert msg.index("Purchased") < msg.index("clicks open")
+
+
+def test_semicolon_batch_and_quit_stops():
+    gs = make_state()
+    msg, done = dispatch(gs, "stats; attack ;; quit; stats")
+    assert "HP" in msg and "strike" in msg.lower()
+    assert done
+    assert msg.count("HP ") == 1
+
+
+def test_batch_limit_and_response_cap():
+    gs = make_state()
+    msg, _ = dispatch_many(gs, ";".join(["help"] * (BATCH_LIMIT + 5)))
+    assert len(msg) <= RESPONSE_CAP
+    msg, _ = dispatch_many(gs, ["stats"] * (BATCH_LIMIT + 3))
+    assert "3 more skipped" in msg
@@ -0,0 +1,71 @@
+import pytest
+
+from astrarpg.engine import content
+
+EXTRA = """
+fish = ["a drowned lantern"]
+
+[[loot]]
+code = "copper"
+name = "Tarnished Cache"
+tier = 1
+price = 4
+
+[[loot]]
+code = "bone"
+name = "Bone Casket"
+tier = 2
+price = 25
+"""
+
+
+def test_core_pack_matches_engine_tables():
+    from astrarpg.engine.loot import pool
+    from astrarpg.engine.map import zone_for
+
+    c = content.load(cache_dir=None)
+    assert [b.code for b in pool()] == [row[0] for row in c.loot]
+    assert zone_for("p", 0, 0).biome in c.biomes
+    assert c.fish[-1] == "nothing"
+
+
+def test_extra_pack_overrides_and_appends(tmp_path):
+    (tmp_path / "extra.toml").write_text(EXTRA)
+    c = content.load([content.CONTENT_DIR, tmp_path], cache_dir=None)
+    codes = [row[0] for row in c.loot]
+    assert codes.count("copper") == 1 and codes[-1] == "bone"
+    assert c.loot[0][1] == "Tarnished Cache"
+    assert c.fish[-1] == "a drowned lantern"
+
+
+def test_list_entries_are_appended_with_repeats(tmp_path):
+    (tmp_path / "weights.toml").write_text('fish = ["nothing", "nothing"]\n')
+    core = content.load(cache_dir=None)
+    c = content.load([content.CONTENT_DIR, tmp_path], cache_dir=None)
+    assert c.fish == core.fish + ("nothing", "nothing")
+
+
+def test_invalid_pack_rejected(tmp_path):
+    (tmp_path / "bad.toml").write_text('[[loot]]\ncode = "x"\nname = "X"\ntier = 0\nprice = 1\n')
+    with pytest.raises(ValueError):
+        content.load([content.CONTENT_DIR, tmp_path], cache_dir=None)
+
+
+def test_cache_reused_until_sources_change(tmp_path, monkeypatch):
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    (packs / "extra.toml").write_text(EXTRA)
+    cache = tmp_path / "cache"
+    first = content.load([content.CONTENT_DIR, packs], str(cache))
+    assert len(list(cache.glob("content-*.bin"))) == 1
+
+    calls = []
+    real = content.compile_packs
+    monkeypatch.setattr(content, "compile_packs", lambda p: calls.append(1) or real(p))
+    assert content.load([content.CONTENT_DIR, packs], str(cache)) == first
+    assert calls == []
+    (packs / "extra.toml").write_text(EXTRA.replace("drowned lantern", "rusted key"))
+    changed = content.load([content.CONTENT_DIR, packs], str(cache))
+    assert calls == [1] and changed.fish[-1] == "a rusted key"
+    # The cache for the old sources is removed
+    assert len(list(cache.glob("content-*.bin"))) == 1
@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+from astrarpg.adapters.discord_bot import OutboundQueue
+
+
+def test_outbound_queue_merges_per_interaction_and_caps_length():
+    sent = []
+
+    async def send(target, text):
+        sent.append((target, text))
+
+    long = "\n".join(["x" * 40] * 5)
+
+    async def run():
+        q = OutboundQueue(send, interval=0.0, window=0.01, limit=100)
+        q.put("ctx-a", "first")
+        q.put("ctx-a", "second")
+        q.put("ctx-b", "other")
+        q.put("ctx-c", long)
+        await q.join()
+
+    asyncio.run(run())
+    assert ("ctx-a", "first\nsecond") in sent
+    assert ("ctx-b", "other") in sent
+    pieces = [t for target, t in sent if target == "ctx-c"]
+    assert len(pieces) > 1 and all(len(t) <= 100 for t in pieces)
+    assert "\n".join(pieces) == long
+
+
+def test_burst_in_one_channel_is_answered_in_parallel():
+    sent = []
+
+    async def send(target, text):
+        await asyncio.sleep(0.01)  # network round trip
+        sent.append((target, text))
+
+    async def run():
+        # Pacing applies per interaction, so 500 commands from one channel do not queue behind each other
+        q = OutboundQueue(send, interval=1.0, window=0.01)
+        for i in range(500):
+            q.put(f"ctx-{i}", f"reply {i}")
+        await q.join()
+
+    t0 = time.perf_counter()
+    asyncio.run(run())
+    assert time.perf_counter() - t0 < 1.0
+    assert sorted(sent) == sorted((f"ctx-{i}", f"reply {i}") for i in range(500))
+
+
+def test_failed_send_is_dropped_without_blocking_others():
+    sent = []
+
+    async def send(target, text):
+        if target == "bad":
+            raise RuntimeError("webhook expired")
+        sent.append(text)
+
+    async def run():
+        q = OutboundQueue(send, interval=0.0, window=0.0)
+        q.put("bad", "lost")
+        q.put("good", "hello")
+        await q.join()
+
+    asyncio.run(run())
+    assert sent == ["hello"]
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from astrarpg.engine import events
+from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.models import Player
+
+CHAIN = {
+    "id": "fork",
+    "title": "Fork",
+    "start": "a",
+    "nodes": {
+        "a": {"text": "A fork.", "choices": [{"label": "Left", "to": ["b", "c"]}, {"label": "Stay", "to": ["a"]}]},
+        "b": {"text": "Gold.", "gold": 5, "choices": []},
+        "c": {"text": "Dust.", "choices": []},
+    },
+}
+
+
+def test_compile_tables():
+    book = events.EventBook.compile([CHAIN])
+    assert book.chain_ids == ["fork"] and book.chain_start[0] == 0
+    assert list(book.choices(0)) == [0, 1]
+    assert book.is_end(1) and book.node_gold[1] == 5
+    assert list(book.targets) == [1, 2, 0]
+
+
+def test_compile_rejects_dangling_targets():
+    bad = json.loads(json.dumps(CHAIN))
+    bad["nodes"]["a"]["choices"][0]["to"] = ["nowhere"]
+    with pytest.raises(ValueError):
+        events.EventBook.compile([bad])
+
+
+def test_choose_is_seeded():
+    book = events.EventBook.compile([CHAIN])
+    outcomes = {events.choose(book, 0, 1, f"p{i}", 0)[0] for i in range(40)}
+    assert outcomes == {1, 2}
+    assert events.choose(book, 0, 1, "p1", 0) == events.choose(book, 0, 1, "p1", 0)
+    with pytest.raises(ValueError):
+        events.choose(book, 0, 3, "p1", 0)
+
+
+def test_load_book_uses_compiled_cache(tmp_path, monkeypatch):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "fork.json").write_text(json.dumps(CHAIN))
+    cache = tmp_path / "cache"
+    first = events.load_book(src, str(cache))
+    assert len(list(cache.iterdir())) == 1
+
+    def boom(*a, **k):
+        raise AssertionError("recompiled despite cache")
+
+    monkeypatch.setattr(events.EventBook, "compile", classmethod(boom))
+    second = events.load_book(src, str(cache))
+    assert second.node_text == first.node_text and list(second.targets) == list(first.targets)
+
+
+def test_shipped_chains_compile():
+    book = events.load_book(cache_dir=None)
+    assert len(book.chain_ids) >= 3
+
+
+def test_event_commands_walk_a_chain():
+    gs = GameState(Player(id="ev", name="E"))
+    msg, _ = dispatch(gs, "choose 1")
+    assert "Nothing awaits" in msg
+    msg, _ = dispatch(gs, "event")
+    assert " 1) " in msg
+    for _ in range(10):
+        if gs.event_node is None:
+            break
+        dispatch(gs, "choose 1")
+    assert gs.event_node is None and gs.events_done == 1
@@ -0,0 +1,78 @@
+from astrarpg.engine import farming
+from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.models import Player
+from astrarpg.engine.offline import FARM_INTERVAL
+
+
+def test_sow_and_tend_deterministic():
+    a = farming.sow("p1", 500)
+    b = farming.sow("p1", 500)
+    assert a.planes == b.planes
+    farming.tend(a, 5)
+    farming.tend(b, 5)
+    assert a.planes == b.planes and a.generation == 5
+    assert all(p >> 500 == 0 for p in a.planes)
+
+
+def test_tend_alleles_come_from_parents(monkeypatch):
+    f = farming.sow("p2", 256)
+    for k in range(len(f.planes)):
+        f.planes[k] = 0
+    monkeypatch.setattr(farming, "MUTATION_BITS", 64)  # effectively no mutation
+    farming.tend(f, 3)
+    assert all(p == 0 for p in f.planes)
+
+
+def test_cull_keeps_only_carriers():
+    f = farming.sow("p3", 1000)
+    before = farming.phenotypes(f)["yield"]
+    replaced = farming.cull(f, "yield")
+    after = farming.phenotypes(f)["yield"]
+    assert after == before + replaced
+    assert after == 1000
+
+
+def test_genotype_format():
+    f = farming.sow("p4", 16)
+    g = farming.genotype(f, 0)
+    assert len(g.split()) == len(farming.TRAITS)
+
+
+def test_farm_commands():
+    gs = GameState(Player(id="farmer", name="F"))
+    now = [1_700_000_000.0]
+    gs.clock = lambda: now[0]
+    gs.last_claim = now[0]
+    msg, _ = dispatch(gs, "farm")
+    assert "fallow" in msg
+    msg, _ = dispatch(gs, "farm plant 2000")
+    assert "2000" in msg
+    msg, _ = dispatch(gs, "farm harvest")
+    assert "Already" in msg
+    now[0] += 3 * FARM_INTERVAL
+    msg, _ = dispatch(gs, "farm tend 5")
+    assert "generation 3" in msg
+    msg, _ = dispatch(gs, "farm harvest")
+    assert "harvest" in msg and gs.produce > 0
+    msg, _ = dispatch(gs, "farm harvest")
+    assert "Already" in msg
+    msg, _ = dispatch(gs, "farm info 1")
+    assert msg.startswith("Plant 1:")
+    msg, _ = dispatch(gs, "farm")
+    assert "generation 3" in msg and "yield" in msg
+
+
+def test_tending_is_limited_by_time():
+    gs = GameState(Player(id="farmer2", name="F"))
+    now = [1_700_000_000.0]
+    gs.clock = lambda: now[0]
+    gs.last_claim = now[0]
+    dispatch(gs, "farm plant 64")
+    now[0] += FARM_INTERVAL
+    dispatch(gs, "; ".join(["farm tend 1", "farm harvest"] * 10))
+    once = gs.produce
+    assert gs.field.generation == 1 and once > 0
+    assert "still growing" in dispatch(gs, "farm tend")[0]
+    # Replanting does not reset the clock into a free harvest
+    dispatch(gs, "farm plant 64; farm harvest; farm tend; farm harvest")
+    assert gs.produce == once
@@ -0,0 +1,54 @@
+from astrarpg.engine import hazards
+from astrarpg.engine.combat import player_attack
+from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.hazards import BUCKET_SECONDS, CHUNK, PREFETCH_LEAD, Hazard, HazardCache
+from astrarpg.engine.models import Monster, Player
+
+T0 = 1_700_000_000 // BUCKET_SECONDS * BUCKET_SECONDS
+
+
+def test_same_chunk_same_hazard():
+    c = HazardCache()
+    a = c.get(0, 0, T0 + 5)
+    b = c.get(CHUNK - 1, CHUNK - 1, T0 + 100)
+    assert a is b
+    assert a == hazards.roll(0, 0, T0 // BUCKET_SECONDS)
+
+
+def test_cache_prefetches_next_bucket_and_evicts_old(monkeypatch):
+    c = HazardCache()
+    c.get(0, 0, T0)
+    c.get(10, 10, T0)
+    assert len(c) == 2
+    calls = []
+    real = hazards.roll
+    monkeypatch.setattr(hazards, "roll", lambda *a: calls.append(a) or real(*a))
+    c.get(0, 0, T0 + BUCKET_SECONDS - PREFETCH_LEAD + 1)
+    assert len(calls) == 2 and len(c) == 4
+    calls.clear()
+    # After the rollover both active chunks are already rolled
+    c.get(0, 0, T0 + BUCKET_SECONDS + 1)
+    c.get(10, 10, T0 + BUCKET_SECONDS + 2)
+    assert calls == []
+    assert len(c) == 2
+
+
+def test_hazard_modifies_swings():
+    storm = Hazard("test", 2, 0, "")
+    m1 = Monster(biome="wastes", tier=1, name="Carrion Rat", hp=40, max_hp=40)
+    m2 = Monster(biome="wastes", tier=1, name="Carrion Rat", hp=40, max_hp=40)
+    p = Player(id="h", name="H", attack=3)
+    player_attack(p, m1)
+    player_attack(p, m2, storm)
+    assert m1.hp - m2.hp == 2
+
+
+def test_zone_and_map_show_weather():
+    gs = GameState(Player(id="w", name="W"))
+    gs.hazards = HazardCache()
+    gs.clock = lambda: T0 + 10
+    msg, _ = dispatch(gs, "zone")
+    assert "Weather:" in msg
+    msg, _ = dispatch(gs, "map")
+    assert "Weather here:" in msg
+    assert len(gs.hazards) == 1
@@ -0,0 +1,109 @@
+import random
+import threading
+
+import pytest
+
+from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.leaderboard import Leaderboard, SortedScores
+from astrarpg.engine.models import Item, Player
+
+
+def test_sorted_scores_matches_sorted_list():
+    ss = SortedScores(load=8)
+    ref = []
+    r = random.Random(3)
+    for _ in range(2000):
+        key = (r.randint(-50, 0), f"p{r.randint(0, 300)}")
+        if key in ref:
+            ss.remove(key)
+            ref.remove(key)
+        else:
+            ss.add(key)
+            ref.append(key)
+    ref.sort()
+    assert list(ss.head(len(ref) + 5)) == ref
+    assert len(ss) == len(ref)
+    assert all(ss.rank(k) == i for i, k in enumerate(ref[:50]))
+
+
+def test_sorted_scores_keys_past_the_end():
+    ss = SortedScores(load=4)
+    ss.add((-5, "a"))
+    assert ss.rank((0, "z")) == 1
+    with pytest.raises(KeyError):
+        ss.remove((0, "z"))
+
+
+def test_leaderboard_survives_concurrent_updates():
+    lb = Leaderboard()
+    errors = []
+
+    def worker(n):
+        r = random.Random(n)
+        try:
+            for _ in range(3000):
+                lb.update(f"t{n}-{r.randrange(20)}", "gold", r.randrange(1000))
+                lb.top("gold", 5)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    top = lb.top("gold", 1000)
+    assert len(top) == 160
+    assert [s for _, s in top] == sorted((s for _, s in top), reverse=True)
+    assert all(lb.score(pid, "gold") == s for pid, s in top)
+
+
+def test_leaderboard_updates_move_players():
+    lb = Leaderboard()
+    for i, g in enumerate([5, 50, 20]):
+        lb.update(f"p{i}", "gold", g)
+    assert lb.top("gold", 2) == [("p1", 50), ("p2", 20)]
+    lb.update("p0", "gold", 100)
+    assert lb.top("gold", 1) == [("p0", 100)]
+    assert lb.rank("p1", "gold") == 2
+    assert lb.rank("nobody", "gold") is None
+    assert {r["player_id"] for r in lb.drain_dirty()} == {"p0", "p1", "p2"}
+    assert not lb.dirty
+
+
+def test_dispatch_keeps_board_current():
+    board = Leaderboard()
+    gs = GameState(Player(id="lb1", name="Rich"))
+    gs.board = board
+    gs.player.gold = 30
+    gs.player.inventory.append(Item(name="Relic", power=7))
+    dispatch(gs, "stats")
+    assert board.score("lb1", "gold") == 30
+    dispatch(gs, "equip 1; travel n; attack")
+    assert board.score("lb1", "power") == 7
+    assert board.score("lb1", "explored") == 2
+    assert board.score("lb1", "bestiary") == 1
+    other = GameState(Player(id="lb2", name="Poor"))
+    other.board = board
+    msg, _ = dispatch(other, "leaderboard gold")
+    assert msg.splitlines()[1] == " 1) Rich - 30"
+    assert "You: #2 of 2" in msg
+    msg, _ = dispatch(other, "leaderboard wisdom")
+    assert "Rank by which" in msg
+
+
+def test_scores_sql_roundtrip(tmp_path):
+    sa = pytest.importorskip("sqlalchemy")
+    from astrarpg.engine.persistence import ensure_scores_schema, load_leaderboard, save_scores, top_scores
+
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 's.db'}")
+    ensure_scores_schema(engine)
+    lb = Leaderboard()
+    for i in range(20):
+        lb.names[f"p{i}"] = f"P{i}"
+        lb.update(f"p{i}", "gold", i * 3)
+    save_scores(engine, lb.drain_dirty())
+    assert top_scores(engine, "gold", 2) == [("p19", "P19", 57), ("p18", "P18", 54)]
+    warm = load_leaderboard(engine)
+    assert warm.top("gold", 3) == lb.top("gold", 3)
@@ -0,0 +1,71 @@
+from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.models import Player
+from astrarpg.engine.offline import floor_sum, lucky_count, progress
+
+HOUR = 3600
+YEAR = 365 * 24 * HOUR
+
+
+def test_floor_sum_matches_brute_force():
+    for n, m, a, b in [(0, 5, 3, 1), (10, 7, 3, 2), (37, 13, 100, 55), (50, 1, 9, 4)]:
+        assert floor_sum(n, m, a, b) == sum((a * i + b) // m for i in range(n))
+
+
+def test_lucky_count_is_additive():
+    whole = lucky_count("p1", "farm", 100, 5000, 5)
+    split = lucky_count("p1", "farm", 100, 2222, 5) + lucky_count("p1", "farm", 2222, 5000, 5)
+    assert whole == split
+    assert 0 < whole < 4900
+
+
+def test_progress_deterministic_and_split_invariant():
+    p = Player(id="idle", name="Idle")
+    t0 = 1_700_000_123
+    once = progress(p, t0, t0 + 2 * HOUR)
+    assert once == progress(p, t0, t0 + 2 * HOUR)
+    a = progress(p, t0, t0 + HOUR + 17)
+    b = progress(p, t0 + HOUR + 17, t0 + 2 * HOUR)
+    assert a.produce + b.produce == once.produce
+    assert a.kills + b.kills == once.kills
+    assert a.gold + b.gold == once.gold
+
+
+def test_progress_over_a_year_scales():
+    p = Player(id="idle", name="Idle")
+    t0 = 1_700_000_000
+    hour = progress(p, t0, t0 + HOUR)
+    year = progress(p, t0, t0 + YEAR)
+    assert year.kills > hour.kills * 8000
+    assert year.produce > 0 and year.gold > 0
+
+
+def test_claim_command_applies_gains():
+    gs = GameState(Player(id="idle", name="Idle"))
+    now = [1_700_000_000.0]
+    gs.clock = lambda: now[0]
+    gs.last_claim = now[0]
+    msg, _ = dispatch(gs, "claim")
+    assert "Nothing" in msg
+    now[0] += 3 * HOUR
+    msg, done = dispatch(gs, "claim")
+    assert "While away" in msg and not done
+    assert gs.player.gold > 0 and gs.produce > 0
+
+
+def test_gear_changes_settle_past_progress_first():
+    from astrarpg.engine.models import Item
+
+    def away(then):
+        gs = GameState(Player(id="idle", name="Idle"))
+        gs.player.inventory.append(Item(name="Relic", power=99))
+        now = [1_700_000_000.0]
+        gs.clock = lambda: now[0]
+        gs.last_claim = now[0]
+        now[0] += 24 * HOUR
+        msg, _ = dispatch(gs, then)
+        return gs, msg
+
+    plain, _ = away("claim")
+    geared, msg = away("equip 1; claim")
+    assert msg.startswith("While away") and msg.endswith("Nothing has accrued yet. Come back later.")
+    assert geared.player.gold == plain.player.gold
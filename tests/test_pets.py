@@ -0,0 +1,87 @@
+from astrarpg.engine import pets
+from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.models import Monster, Player
+
+
+def founders(k, n=2, species="Carrion Rat"):
+    return [k.add(f"F{i}", species, pets.pack_traits((40, 30, 10, i))) for i in range(n)]
+
+
+def test_trait_packing_roundtrip():
+    t = (1, 200, 255, 0)
+    assert pets.unpack_traits(pets.pack_traits(t)) == t
+    assert pets.unpack_traits(pets.pack_traits((300, -5, 7, 9))) == (255, 0, 7, 9)
+
+
+def test_inbreeding_coefficients():
+    k = pets.Kennel()
+    a, b = founders(k)
+    c = pets.breed(k, "p", a, b)
+    d = pets.breed(k, "p", a, b)
+    assert k.coi[c] == 0.0
+    # Full siblings: kinship 1/4, so their offspring have F = 0.25
+    e = pets.breed(k, "p", c, d)
+    assert abs(k.coi[e] - 0.25) < 1e-9
+    # Parent x offspring also gives F = 0.25
+    f = pets.breed(k, "p", a, c)
+    assert abs(k.coi[f] - 0.25) < 1e-9
+    assert k.ancestors(e) == {c: 1, d: 1, a: 2, b: 2}
+
+
+def test_breed_rejects_mismatched_species():
+    k = pets.Kennel()
+    a = founders(k, 1, "Carrion Rat")[0]
+    b = founders(k, 1, "Ash Hound")[0]
+    try:
+        pets.breed(k, "p", a, b)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_kennel_bytes_roundtrip():
+    k = pets.Kennel()
+    a, b = founders(k)
+    for _ in range(5):
+        a = pets.breed(k, "p", a, b)
+    k2 = pets.Kennel.from_bytes(k.to_bytes())
+    assert k2.names == k.names and k2.species_names == k.species_names
+    assert list(k2.sire) == list(k.sire) and list(k2.coi) == list(k.coi)
+    assert k2.traits_of(len(k2) - 1) == k.traits_of(len(k) - 1)
+    assert len(pets.Kennel.from_bytes(pets.Kennel().to_bytes())) == 0
+
+
+def test_tame_attempts_are_deterministic_but_independent():
+    m = Monster(biome="wastes", tier=1, name="Carrion Rat", hp=0)
+    # For "pid", attempts 0-2 fail and attempt 3 succeeds; the same attempt always repeats
+    assert [pets.tame(pets.Kennel(), "pid", m, a) for a in range(4)] == [None, None, None, 0]
+    k1, k2 = pets.Kennel(), pets.Kennel()
+    assert pets.tame(k1, "pid", m, 3) == pets.tame(k2, "pid", m, 3) == 0
+    assert k1.names == k2.names == ["Solul"]
+    assert pets.unpack_traits(k1.traits[0]) == pets.unpack_traits(k2.traits[0]) == (13, 14, 12, 49)
+    assert k1.species_names[k1.species[0]] == "Carrion Rat"
+
+
+def test_failed_tame_does_not_doom_later_kills():
+    gs = GameState(Player(id="pid", name="P"))
+    for _ in range(10):
+        gs.current = Monster(biome="wastes", tier=1, name="Carrion Rat", hp=0)
+        gs.tame_tried = False  # as after a fresh kill
+        dispatch(gs, "tame")
+    assert gs.tame_attempts == 10 and len(gs.kennel) > 0
+
+
+def test_pet_commands():
+    gs = GameState(Player(id="tamer", name="T"))
+    msg, _ = dispatch(gs, "tame")
+    assert "Fight one first" in msg
+    founders(gs.kennel, 2)
+    msg, _ = dispatch(gs, "breed 1 2")
+    assert "whelp" in msg and len(gs.kennel) == 3
+    msg, _ = dispatch(gs, "stable")
+    assert "3 beasts" in msg and " 3) " in msg
+    msg, _ = dispatch(gs, "pet 3")
+    assert "Parents: F0, F1" in msg
+    msg, _ = dispatch(gs, "breed 1 1")
+    assert "itself" in msg
@@ -0,0 +1,57 @@
+import pytest
+
+from astrarpg.engine import skilltree
+from astrarpg.engine.combat import player_attack
+from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.models import Item, Monster, Player
+
+
+def test_compile_modifiers_cached_per_skill_set():
+    a = skilltree.compile_modifiers(frozenset({"edge", "rend"}))
+    b = skilltree.compile_modifiers(frozenset({"rend", "edge"}))
+    assert a is b
+    assert a.attack == 3 and a.defense == 0
+
+
+def test_effective_stats_apply_flat_then_percent():
+    p = Player(id="s", name="S", attack=10, defense=4)
+    p.skills = frozenset({"edge", "rend", "fury", "hide"})
+    assert skilltree.effective_stats(p) == ((10 + 3) * 120 // 100, 5)
+
+
+def test_unlock_checks_prereqs_and_gold():
+    p = Player(id="s", name="S", gold=50)
+    with pytest.raises(ValueError, match="Requires"):
+        skilltree.unlock(p, "rend")
+    skilltree.unlock(p, "edge")
+    assert p.gold == 40 and "edge" in p.skills
+    with pytest.raises(ValueError, match="Already"):
+        skilltree.unlock(p, "edge")
+    p.gold = 29
+    with pytest.raises(ValueError, match="Costs 30g"):
+        skilltree.unlock(p, "rend")
+    assert p.gold == 29 and "rend" not in p.skills
+
+
+def test_combat_uses_effective_stats():
+    m1 = Monster(biome="wastes", tier=1, name="Carrion Rat", hp=50, max_hp=50)
+    m2 = Monster(biome="wastes", tier=1, name="Carrion Rat", hp=50, max_hp=50)
+    plain = Player(id="c", name="C", attack=3)
+    skilled = Player(id="c", name="C", attack=3, skills=frozenset({"edge", "rend"}))
+    player_attack(plain, m1)
+    player_attack(skilled, m2)
+    assert m1.hp - m2.hp == 3
+
+
+def test_skills_and_learn_commands():
+    gs = GameState(Player(id="l", name="L", gold=100))
+    gs.player.inventory.append(Item(name="Scrap", power=2))
+    dispatch(gs, "equip 1 weapon")
+    msg, _ = dispatch(gs, "learn edge")
+    assert "Honed Edge" in msg
+    msg, _ = dispatch(gs, "stats")
+    assert "ATK 5" in msg
+    msg, _ = dispatch(gs, "skills")
+    assert "[x] Honed Edge" in msg and "[ ] Rend" in msg and "[-] Carrion Fury" in msg
+    msg, _ = dispatch(gs, "learn nope")
+    assert "No such skill" in msg
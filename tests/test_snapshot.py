@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+from astrarpg.engine import pets, snapshot
+from astrarpg.engine.commands import GameState, dispatch
+from astrarpg.engine.events import default_book
+from astrarpg.engine.farming import sow
+from astrarpg.engine.loot import box_item
+from astrarpg.engine.models import Item, Monster, Player
+
+
+def busy_state():
+    gs = GameState(Player(id="u1", name="Ash", gold=120))
+    gs.board = None
+    p = gs.player
+    p.inventory = [Item("Rusted Blade", 3), box_item("ash", "Ash Box", 2), Item("Bone Charm", 0)]
+    p.equipped_weapon = Item("Iron Sword", 4)
+    p.skills = frozenset({"edge"})
+    gs.current = Monster("ashlands", 2, "Ash Hound", 5, 9, 3, 1)
+    gs.pos = (4, 1)
+    gs.visited = {(3, 2), (4, 2), (4, 1)}
+    gs.discovered = {"Ash Hound", "Carrion Rat"}
+    gs.field = sow("u1", 64)
+    gs.base.place(0, 0, "hearth")
+    gs.base.place(1, 0, "forge")
+    gs.kennel.add("Rex", "Carrion Rat", pets.pack_traits((40, 30, 10, 1)))
+    gs.event_node = default_book().chain_start[0] + 1
+    gs.events_done = 2
+    gs.tame_attempts = 5
+    gs.produce = 17
+    return gs
+
+
+def fields(gs):
+    p = gs.player
+    return (
+        (p.id, p.name, p.hp, p.gold, p.equipped_weapon, p.equipped_armor, p.skills),
+        (gs.current, gs.pos, gs.map_size, gs.visited, gs.discovered, gs.shop_cycle, gs.shop_cache),
+        (gs.field, gs.base.cells, gs.base.bonus, gs.kennel.to_bytes()),
+        (gs.event_node, gs.events_done, gs.produce, gs.last_claim, gs.tame_attempts),
+    )
+
+
+def names(inv):
+    return [(it.name, getattr(it, "power", None), getattr(it, "_box_code", None)) for it in inv]
+
+
+def test_roundtrip_preserves_state():
+    gs = busy_state()
+    dispatch(gs, "shop")
+    out = snapshot.loads(snapshot.dumps(gs))
+    assert fields(out) == fields(gs)
+    assert names(out.player.inventory) == names(gs.player.inventory)
+
+
+def test_inventory_decodes_lazily():
+    gs = busy_state()
+    gs.player.inventory = [Item(f"Blade {i % 5}", i) for i in range(1000)]
+    out = snapshot.loads(snapshot.dumps(gs))
+    inv = out.player.inventory
+    assert len(inv) == 1000 and not inv.decoded
+    assert inv[999] == Item("Blade 4", 999)
+    assert inv.decoded
+    inv.append(Item("New", 1))
+    assert len(inv) == 1001
+    assert isinstance(snapshot.loads(snapshot.dumps(gs), lazy=False).player.inventory, list)
+
+
+def test_restored_state_keeps_playing():
+    gs = busy_state()
+    out = snapshot.loads(snapshot.dumps(gs))
+    out.board = None
+    assert "Ash Box" in dispatch(out, "inv")[0]
+    assert "clicks open" in dispatch(out, "open 1")[0]
+    assert "ATK" in dispatch(out, "stats")[0]
+
+
+def test_unknown_skills_are_dropped():
+    gs = busy_state()
+    gs.player.skills = frozenset({"edge", "retired-node"})
+    out = snapshot.loads(snapshot.dumps(gs))
+    assert out.player.skills == frozenset({"edge"})
+    dispatch(out, "stats")
+
+
+def test_unknown_base_structures_are_skipped(monkeypatch):
+    from astrarpg.engine import basebuilding
+
+    blob = snapshot.dumps(busy_state())
+    objects = dict(basebuilding.OBJECTS)
+    del objects["forge"]
+    monkeypatch.setattr(basebuilding, "OBJECTS", objects)
+    out = snapshot.loads(blob)
+    assert out.base.at(0, 0) == "hearth" and out.base.at(1, 0) is None
+
+
+def test_box_tiers_are_not_truncated():
+    gs = busy_state()
+    gs.player.inventory = [box_item("deep", "Deep Box", 300)]
+    (box,) = snapshot.loads(snapshot.dumps(gs)).player.inventory
+    assert (box._box_code, box._box_tier, box.name) == ("deep", 300, "[BOX] Deep Box")
+
+
+def test_strings_are_stored_once():
+    gs = busy_state()
+    gs.player.inventory = [Item("Rusted Blade", 3)] * 200
+    blob = snapshot.dumps(gs)
+    assert blob.count(b"Rusted Blade") == 1
+    assert len(blob) < len(json.dumps([{"name": "Rusted Blade", "power": 3}] * 200))
+
+
+def test_rejects_foreign_or_future_data():
+    blob = bytearray(snapshot.dumps(busy_state()))
+    with pytest.raises(ValueError):
+        snapshot.loads(b"JUNK" + bytes(blob[4:]))
+    blob[4] = snapshot.VERSION + 1
+    with pytest.raises(ValueError):
+        snapshot.loads(bytes(blob))
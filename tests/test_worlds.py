@@ -0,0 +1,166 @@
+import threading
+
+import pytest
+
+from astrarpg.engine.commands import dispatch
+from astrarpg.engine.generation import in_world, make_seed
+from astrarpg.engine.loot import shop_offers
+from astrarpg.engine.map import zone_for
+from astrarpg.engine.worlds import World, WorldRegistry
+
+
+class Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+def test_world_id_changes_every_seed():
+    base = make_seed("zone", "p1", 1, 2)
+    with in_world(""):
+        assert make_seed("zone", "p1", 1, 2) == base
+    with in_world("g1"):
+        assert make_seed("zone", "p1", 1, 2) != base
+        g1 = [zone_for("p1", x, 0).name for x in range(8)]
+        offers = shop_offers("p1")
+    assert g1 != [zone_for("p1", x, 0).name for x in range(8)]
+    with in_world("g1"):
+        assert shop_offers("p1") == offers
+
+
+def test_worlds_isolate_sessions_boards_and_hazards():
+    a, b = World("g1"), World("g2")
+    ga, gb = a.session("u", "U"), b.session("u", "U")
+    assert ga is not gb and ga.world == "g1"
+    assert ga.board is a.board and gb.hazards is b.hazards and a.hazards is not b.hazards
+    ga.player.gold = 50
+    dispatch(ga, "stats")
+    assert a.board.score("u", "gold") == 50 and b.board.score("u", "gold") == 0
+    assert dispatch(ga, "zone")[0] != dispatch(gb, "zone")[0]
+    assert a.session("u", "U") is ga
+
+
+def test_world_dump_and_load_roundtrip():
+    w = World("g1")
+    gs = w.session("u", "U")
+    gs.player.gold = 9
+    dispatch(gs, "travel e")
+    back = World.load("g1", w.dump())
+    restored = back.sessions["u"]
+    assert restored.world == "g1" and restored.board is back.board
+    assert restored.pos == gs.pos and back.board.score("u", "gold") == 9
+    assert dispatch(restored, "zone")[0] == dispatch(gs, "zone")[0]
+
+
+def test_registry_evicts_idle_worlds():
+    clock = Clock()
+    reg = WorldRegistry(clock=clock)
+    reg.get("g1").session("u", "U")
+    clock.t = 50
+    reg.get("g2")
+    clock.t = 120
+    assert reg.evict_idle(100) == ["g1"]
+    assert "g1" not in reg and "g2" in reg
+    # Without a database an evicted world starts over
+    assert len(reg.get("g1")) == 0
+
+
+def test_unload_keeps_worlds_used_since_the_idle_scan():
+    clock = Clock()
+    reg = WorldRegistry(clock=clock)
+    reg.get("g1")
+    clock.t = 200
+    reg.get("g1")  # a worker touches it after evict_idle picked it
+    assert reg.unload("g1", idle_since=100) is None
+    assert "g1" in reg
+    assert reg.unload("g1", idle_since=200) == {}
+
+
+def test_cold_load_does_not_block_other_worlds():
+    started, release = threading.Event(), threading.Event()
+
+    class SlowRegistry(WorldRegistry):
+        def _load(self, world_id):
+            if world_id == "slow":
+                started.set()
+                release.wait(5)
+            return super()._load(world_id)
+
+    reg = SlowRegistry()
+    results = []
+    loaders = [threading.Thread(target=lambda: results.append(reg.get("slow"))) for _ in range(2)]
+    for t in loaders:
+        t.start()
+    assert started.wait(5)
+    assert reg.get("fast").id == "fast" and "slow" not in reg
+    release.set()
+    for t in loaders:
+        t.join()
+    assert results[0] is results[1]
+
+
+def test_registry_saves_and_restores_worlds(tmp_path):
+    sa = pytest.importorskip("sqlalchemy")
+    from astrarpg.engine.persistence import top_scores
+
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'w.db'}")
+    with engine.begin() as c:
+        # A database from before worlds existed keeps its single-world score table
+        c.execute(sa.text("CREATE TABLE player_scores (player_id TEXT PRIMARY KEY, name TEXT NOT NULL)"))
+    reg = WorldRegistry(engine)
+    for wid, gold in (("g1", 10), ("g2", 20)):
+        gs = reg.get(wid).session("u", "U")
+        gs.player.gold = gold
+        dispatch(gs, "stats")
+    reg.get("g2").sessions["u"].kennel.add("Rex", "Carrion Rat", 0)
+    reg.unload_all()
+    assert len(reg) == 0
+    assert top_scores(engine, "gold", world="g1") == [("u", "U", 10)]
+    assert top_scores(engine, "gold", world="g2") == [("u", "U", 20)]
+    w = reg.get("g2")
+    assert w.sessions["u"].player.gold == 20 and w.board.top("gold") == [("u", 20)]
+    assert w.sessions["u"].kennel.names == ["Rex"] and len(reg.get("g1").sessions["u"].kennel) == 0
+    assert len(reg.get("g3")) == 0
+
+
+def test_failed_save_keeps_world_loaded(tmp_path, monkeypatch):
+    sa = pytest.importorskip("sqlalchemy")
+    from astrarpg.engine import persistence
+
+    real = persistence.save_world
+
+    def flaky(engine, world, blobs):
+        if world == "g1":
+            raise OSError("disk full")
+        real(engine, world, blobs)
+
+    monkeypatch.setattr(persistence, "save_world", flaky)
+    reg = WorldRegistry(sa.create_engine(f"sqlite:///{tmp_path / 'f.db'}"))
+    for wid in ("g1", "g2"):
+        reg.get(wid).session("u", "U").player.gold = 7
+    with pytest.raises(OSError):
+        reg.unload("g1")
+    assert reg.get("g1").sessions["u"].player.gold == 7
+    # One failing world does not stop the others
+    assert reg.evict_idle(-1) == ["g2"]
+    assert reg.unload_all() == ["g1"] and "g1" in reg
+
+
+def test_concurrent_first_commands_share_one_session():
+    for _ in range(50):
+        w = World("g")
+        barrier = threading.Barrier(4)
+        got = []
+
+        def first():
+            barrier.wait()
+            got.append(w.session("new", "N"))
+
+        threads = [threading.Thread(target=first) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert all(gs is got[0] for gs in got)